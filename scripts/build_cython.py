@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Compile pure-Python git_dungeon modules in place with Cython."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def main(argv: list[str] | None = None) -> int:
+    modules = argv or sys.argv[1:]
+    if not modules:
+        print("usage: build_cython.py <module> [<module> ...]", file=sys.stderr)
+        return 2
+
+    from Cython.Build import cythonize
+    from setuptools import Extension, setup
+
+    # Extensions are named explicitly and built from src/: `cythonize -i`
+    # would infer a `src.git_dungeon...` name (src/ holds the legacy
+    # package) and let pyproject's package-dir misplace the output.
+    # Intermediate objects go to a temp dir so nothing is left under src/.
+    os.chdir(SRC_DIR)
+    extensions = [
+        Extension(module, [module.replace(".", "/") + ".py"]) for module in modules
+    ]
+    with tempfile.TemporaryDirectory() as build_temp:
+        setup(
+            script_name="setup.py",
+            script_args=[
+                "build_ext", "--inplace", "--build-temp", build_temp, "--build-lib", build_temp,
+            ],
+            ext_modules=cythonize(
+                extensions,
+                language_level=3,
+                compiler_directives={"boundscheck": False, "wraparound": False, "cdivision": True},
+            ),
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
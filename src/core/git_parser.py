@@ -1,12 +1,20 @@
 """Git parser for reading commit history - Optimized version."""
 
+import json
 import os
 import subprocess
+import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Callable, Iterator, Optional
 
 from git import Repo
-from git.exc import InvalidGitRepositoryError, BadName
+from git.exc import InvalidGitRepositoryError, NoSuchPathError, BadName
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
 
 from config.settings import GameConfig
 from .utils.exceptions import GitError
@@ -14,6 +22,9 @@ from .utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Bump when the on-disk history row layout changes
+HISTORY_CACHE_VERSION = 1
+
 
 class FileChange:
     """Represents a file change in a commit."""
@@ -56,6 +67,37 @@ class CommitInfo:
         additions: int = 0,
         deletions: int = 0,
         files_changed: int = 0,
+    ):
+        # Lean constructor for the parsing hot path; pass arguments
+        # positionally. Old-API keywords go through from_legacy().
+        self.hexsha = hexsha
+        self.short_sha = short_sha
+        self.message = message
+        self.author_name = author_name
+        self.author_email = author_email
+        self.committed_datetime = committed_datetime
+        self.additions = additions
+        self.deletions = deletions
+        self.files_changed = files_changed
+        self._file_changes = []
+        self._file_changes_loaded = True
+        self.branches = []
+        self._is_merge = False
+        self._is_revert = False
+    
+    @classmethod
+    def from_legacy(
+        cls,
+        *,
+        hexsha: str = "",
+        short_sha: str = "",
+        message: str = "",
+        author_name: str = "",
+        author_email: str = "",
+        committed_datetime: str = "",
+        additions: int = 0,
+        deletions: int = 0,
+        files_changed: int = 0,
         # Old API compatibility
         hash: str = "",
         short_hash: str = "",
@@ -65,24 +107,26 @@ class CommitInfo:
         is_merge: bool = False,
         is_revert: bool = False,
         branches: list = None,
-    ):
-        # Handle old API aliases
-        self.hexsha = hash or hexsha
-        self.short_sha = short_hash or short_sha
-        self.author_name = author or author_name
-        self.committed_datetime = datetime or committed_datetime
-        self.message = message
-        self.author_email = author_email
-        self.additions = additions
-        self.deletions = deletions
-        self.files_changed = files_changed
-        self._file_changes = file_changes or []
-        self._file_changes_loaded = True  # Old API always loaded
-        self.branches = branches or []
+    ) -> "CommitInfo":
+        """Build a CommitInfo from old-API keyword arguments."""
+        info = cls(
+            hash or hexsha,
+            short_hash or short_sha,
+            message,
+            author or author_name,
+            author_email,
+            datetime or committed_datetime,
+            additions,
+            deletions,
+            files_changed,
+        )
+        info._file_changes = file_changes or []
+        info.branches = branches or []
         
         # Store is_merge and is_revert (can be set explicitly or computed)
-        self._is_merge = is_merge
-        self._is_revert = is_revert
+        info._is_merge = is_merge
+        info._is_revert = is_revert
+        return info
     
     # Backward compatibility aliases and computed properties
     @property
@@ -113,32 +157,38 @@ class CommitInfo:
     @property
     def difficulty_factor(self) -> float:
         """Calculate difficulty factor based on commit size."""
+        additions = self.additions
+        deletions = self.deletions
+        files_changed = self.files_changed
         factor = 1.0
         
         # Add factor for large commits
-        if self.additions > 100:
+        if additions > 100:
             factor += 0.5
-        elif self.additions > 50:
+        elif additions > 50:
             factor += 0.3
         
         # Add factor for deletions
-        if self.deletions > 50:
+        if deletions > 50:
             factor += 0.3
-        elif self.deletions > 20:
+        elif deletions > 20:
             factor += 0.1
         
         # Add factor for many files (> 10 for >= 11)
-        if self.files_changed > 10:
+        if files_changed > 10:
             factor += 0.3
-        elif self.files_changed > 5 and self.files_changed < 10:
+        elif 5 < files_changed < 10:
             factor += 0.1
         
+        # Merge/revert flags share one lowercased message
+        msg = self.message.lower()
+        
         # Add factor for merge commits
-        if self.is_merge:
+        if self._is_merge or "merge" in msg:
             factor += 0.2
         
         # Add factor for revert commits
-        if self.is_revert:
+        if self._is_revert or msg.startswith("revert"):
             factor += 0.5
         
         # Round to 1 decimal place for consistency
@@ -199,52 +249,54 @@ class GitParser:
         self.config = config or GameConfig()
         self._repo: Optional[Repo] = None
         self._commits_cache: list[CommitInfo] = []  # For backward compatibility
-        self._repo_cache: dict[str, Repo] = {}
+        self._use_history_cache: bool = True
+        self._repo_cache: OrderedDict[str, Repo] = OrderedDict()
         self._max_cache_size: int = 5
     
     def _get_repo(self, path: str) -> Repo:
-        """Get cached Repo object."""
-        path = str(path)
-        
-        if path in self._repo_cache:
-            try:
-                if self._repo_cache[path].head.is_valid():
-                    return self._repo_cache[path]
-            except Exception:
-                del self._repo_cache[path]
-        
-        repo = Repo(path, search_parent_directories=True)
-        
-        if len(self._repo_cache) >= self._max_cache_size:
-            self._repo_cache.pop(next(iter(self._repo_cache)))
-        
-        self._repo_cache[path] = repo
+        """Get cached Repo object (least recently used is evicted first)."""
+        # Key by the resolved path only: a relative spelling such as "."
+        # names a different repository depending on the working directory.
+        key = str(Path(path).resolve())
+        
+        repo = self._repo_cache.get(key)
+        if repo is not None:
+            self._repo_cache.move_to_end(key)
+            return repo
+        
+        repo = Repo(key)
+        self._repo_cache[key] = repo
+        while len(self._repo_cache) > self._max_cache_size:
+            self._repo_cache.popitem(last=False)
         return repo
     
-    def load_repository(self, path: str) -> bool:
+    def load_repository(self, path: str, use_cache: bool = True) -> bool:
         """Load a Git repository.
         
+        Args:
+            path: Repository path
+            use_cache: Reuse the parsed history persisted for the current HEAD
+        
         Returns:
             True if repository loaded successfully
         """
         try:
-            repo_path = Path(path).resolve()
-            
-            if not repo_path.exists():
-                raise GitError(f"Repository path does not exist: {path}")
-            
-            if not (repo_path / ".git").exists():
-                raise GitError(f"Not a Git repository: {path}")
-            
-            self._repo = self._get_repo(str(repo_path))
+            # Repo() validates the path itself; the filesystem is only probed
+            # when it refuses, to tell a plain directory from a broken .git.
+            self._repo = self._get_repo(path)
+            self._use_history_cache = use_cache
             
             # Don't check size here - we skip expensive operations
             
             logger.info(f"Loaded repository at {path}")
             return True
             
+        except NoSuchPathError:
+            raise GitError(f"Repository path does not exist: {path}")
         except InvalidGitRepositoryError as e:
-            raise GitError(f"Invalid Git repository: {e}")
+            if (Path(path) / ".git").exists():
+                raise GitError(f"Invalid Git repository: {e}")
+            raise GitError(f"Not a Git repository: {path}")
     
     @property
     def is_loaded(self) -> bool:
@@ -305,6 +357,34 @@ class GitParser:
             # Empty repository - return empty list
             return []
         
+        # Commits are immutable, so history parsed for this HEAD can be reused
+        cached = None
+        if self._use_history_cache:
+            cached = self._load_history_cache(head_commit.hexsha, limit)
+        
+        if cached is not None:
+            commit_infos = cached
+            if include_file_changes:
+                for info in commit_infos:
+                    info._file_changes = self._get_file_changes_fast(info.hexsha)
+                    info._file_changes_loaded = True
+        else:
+            commit_infos = self._walk_commit_history(
+                head_commit, limit, include_file_changes
+            )
+        
+        if reverse:
+            commit_infos.reverse()  # freshly built above, safe to flip in place
+        
+        return commit_infos
+    
+    def _walk_commit_history(
+        self,
+        head_commit,
+        limit: Optional[int],
+        include_file_changes: bool,
+    ) -> list[CommitInfo]:
+        """Walk history from HEAD and persist it when the walk was complete."""
         # Get commits using fast method
         try:
             commits = list(head_commit.iter_items(
@@ -313,6 +393,7 @@ class GitParser:
             ))
         except Exception:
             commits = list(self._repo.iter_commits())
+        total = len(commits)
         
         # Apply limit
         if limit:
@@ -329,11 +410,64 @@ class GitParser:
             
             commit_infos.append(info)
         
-        if reverse:
-            commit_infos = commit_infos[::-1]
+        if self._use_history_cache and len(commit_infos) == total:
+            self._store_history_cache(head_commit.hexsha, commit_infos)
         
         return commit_infos
     
+    def _history_cache_path(self, head_sha: str) -> Path:
+        """Location of the persisted history for a HEAD commit."""
+        cache_dir = Path(self._repo.git_dir) / "git-dungeon" / "history"
+        return cache_dir / f"v{HISTORY_CACHE_VERSION}-{head_sha}.json"
+    
+    def _load_history_cache(
+        self, head_sha: str, limit: Optional[int]
+    ) -> Optional[list[CommitInfo]]:
+        """Read cached history, or None on a cache miss."""
+        try:
+            data = self._history_cache_path(head_sha).read_bytes()
+            rows = orjson.loads(data) if orjson else json.loads(data)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(rows, list):
+            return None
+        if limit:
+            rows = rows[:limit]
+        try:
+            if not all(isinstance(row, list) and len(row) == 9 for row in rows):
+                return None
+            return [CommitInfo(*row) for row in rows]
+        except (TypeError, IndexError, ValueError):
+            # Valid JSON of the wrong shape; rebuild it like a missing file
+            return None
+    
+    def _store_history_cache(self, head_sha: str, commit_infos: list[CommitInfo]) -> None:
+        """Persist parsed history rows for a HEAD commit."""
+        rows = [
+            (
+                c.hexsha, c.short_sha, c.message, c.author_name, c.author_email,
+                c.committed_datetime, c.additions, c.deletions, c.files_changed,
+            )
+            for c in commit_infos
+        ]
+        if any(row[0] == "0" * 40 for row in rows):
+            return  # a commit failed to parse; don't persist the placeholder
+        
+        path = self._history_cache_path(head_sha)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(
+                orjson.dumps(rows) if orjson else json.dumps(rows).encode("utf-8")
+            )
+            os.replace(tmp_path, path)
+            # Only the current HEAD is worth keeping
+            for stale in path.parent.glob("*.json"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not write history cache {path}: {e}")
+    
     def _parse_commit_fast(self, commit) -> CommitInfo:
         """Parse commit without file changes (fast)."""
         try:
@@ -341,56 +475,60 @@ class GitParser:
             
             # Don't access commit.stats - it's very slow (~2ms per commit!)
             # Just use basic commit info
+            hexsha = commit.hexsha
+            author = commit.author
+            # Additions/deletions/files are lazy-loaded on demand if needed
             return CommitInfo(
-                hexsha=commit.hexsha,
-                short_sha=commit.hexsha[:8],
-                message=message,
-                author_name=commit.author.name,
-                author_email=commit.author.email,
-                committed_datetime=str(commit.committed_datetime),
-                additions=0,  # Lazy load on-demand if needed
-                deletions=0,
-                files_changed=0,
+                hexsha,
+                hexsha[:8],
+                message,
+                sys.intern(author.name or ""),
+                sys.intern(author.email or ""),
+                str(commit.committed_datetime),
             )
         except Exception as e:
             logger.error(f"Failed to parse commit: {e}")
             return CommitInfo(
-                hexsha="0" * 40,
-                short_sha="0" * 8,
-                message="Unknown",
-                author_name="Unknown",
-                author_email="unknown",
-                committed_datetime="",
-                additions=0,
-                deletions=0,
-                files_changed=0,
+                "0" * 40, "0" * 8, "Unknown", "Unknown", "unknown", ""
             )
 
     def _get_file_changes_fast(self, commit_hash: str) -> list[FileChange]:
         """Get file changes using subprocess (faster)."""
+        return list(self._iter_file_changes_fast(commit_hash))
+
+    def _iter_file_changes_fast(self, commit_hash: str) -> Iterator[FileChange]:
+        """Yield file changes while `git show` is still writing them.
+
+        Output is consumed line by line, so memory stays flat for commits
+        touching thousands of files and callers may stop early.
+        """
         if self._repo is None:
-            return []
+            return
 
-        file_changes = []
+        cmd = [
+            "git", "show",
+            "--name-status",
+            "--pretty=format:",
+            "-1",
+            commit_hash,
+        ]
 
         try:
-            cmd = [
-                "git", "show",
-                "--name-status",
-                "--pretty=format:",
-                "-1",
-                commit_hash,
-            ]
-
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
+                errors="replace",
+                bufsize=1,
                 cwd=self._repo.working_tree_dir,
-                timeout=2,
             )
+        except OSError:
+            return
 
-            for line in result.stdout.split("\n"):
+        try:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
                 if not line or line.startswith(":"):
                     continue
 
@@ -410,19 +548,21 @@ class GitParser:
                     else:
                         change_type = "M"
 
-                    file_changes.append(
-                        FileChange(
-                            filepath=filepath,
-                            change_type=change_type,
-                            additions=0,  # Would need another call
-                            deletions=0,
-                        )
+                    yield FileChange(
+                        filepath=filepath,
+                        change_type=change_type,
+                        additions=0,  # Would need another call
+                        deletions=0,
                     )
 
-        except Exception:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
             pass
-
-        return file_changes
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
 
 
 def parse_commit_info(
@@ -453,15 +593,15 @@ def parse_commit_info(
         CommitInfo object
     """
     return CommitInfo(
-        hexsha=hexsha,
-        short_sha=short_sha,
-        message=message,
-        author_name=author_name,
-        author_email=author_email,
-        committed_datetime=committed_datetime,
-        additions=additions,
-        deletions=deletions,
-        files_changed=files_changed,
+        hexsha,
+        short_sha,
+        message,
+        author_name,
+        author_email,
+        committed_datetime,
+        additions,
+        deletions,
+        files_changed,
     )
 
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import accumulate
 from typing import Optional
 
 from .component import Component
@@ -261,6 +263,13 @@ class ItemFactory:
         ItemRarity.CORRUPTED: 0.01,
     }
 
+    # Rarity roll table: bisect the cumulative chances instead of re-summing
+    _RARITIES: tuple[ItemRarity, ...] = tuple(RARITY_CHANCES)
+    _CUMULATIVE: tuple[float, ...] = tuple(accumulate(RARITY_CHANCES.values()))
+
+    # Path separators and dots both collapse to "_" in item ids
+    _PATH_TRANS = str.maketrans({"/": "_", ".": "_"})
+
     @classmethod
     def create_from_file(
         cls,
@@ -279,25 +288,22 @@ class ItemFactory:
         import random
 
         # Get extension
-        ext = "." + filepath.split(".")[-1] if "." in filepath else ""
+        dot = filepath.rfind(".")
+        ext = filepath[dot:] if dot >= 0 else ""
 
         # Get item type and base name
         item_info = cls.FILE_EXTENSION_MAP.get(ext, (ItemType.MATERIAL, "材料"))
         item_type, base_name = item_info
 
         # Determine rarity
-        roll = random.random()
-        cumulative = 0
-        for rarity, chance in cls.RARITY_CHANCES.items():
-            cumulative += chance
-            if roll <= cumulative:
-                selected_rarity = rarity
-                break
+        index = bisect_left(cls._CUMULATIVE, random.random())
+        if index < len(cls._RARITIES):
+            selected_rarity = cls._RARITIES[index]
         else:
             selected_rarity = ItemRarity.COMMON
 
         # Create item
-        item_id = f"item_{filepath.replace('/', '_').replace('.', '_')}"
+        item_id = f"item_{filepath.translate(cls._PATH_TRANS)}"
         stats = ItemStats()
 
         if item_type == ItemType.WEAPON:
@@ -309,7 +315,7 @@ class ItemFactory:
 
         item = Item(
             id=item_id,
-            name=f"{base_name} ({filepath.split('/')[-1][:10]})",
+            name=f"{base_name} ({filepath.rpartition('/')[2][:10]})",
             item_type=item_type,
             rarity=selected_rarity,
             description=f"从 {filepath} 掉落的{item_type.value}",
@@ -2,28 +2,107 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib
 import json
+import logging
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import chain
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from git_dungeon.utils.logger import setup_logger
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; large packs are decoded in one piece otherwise
+    ijson = None
+
+# JSON content files at least this large are streamed when ijson is available
+JSON_STREAM_MIN_BYTES = 8 * 1024 * 1024
+# Placeholder payload for a file that is streamed at registration time
+_STREAMED = object()
+
 logger = setup_logger(__name__)
 
+# Lua backends in order of preference: LuaJIT's trace compiler runs
+# content scripts several times faster than PUC Lua.
+LUA_BACKENDS = ("lupa.luajit21", "lupa.luajit20", "lupa.lua54", "lupa")
+
+
+def _import_lua_backend() -> tuple[Any, Optional[str]]:
+    """Import the fastest available lupa backend module."""
+    for module_name in LUA_BACKENDS:
+        try:
+            return importlib.import_module(module_name), module_name
+        except ImportError:
+            continue
+    return None, None
+
+
 # Try to import lupa, but allow graceful degradation
-try:
-    import lupa
-    from lupa import LuaRuntime
+lupa, LUA_BACKEND = _import_lua_backend()
+if lupa is not None:
+    LuaRuntime = lupa.LuaRuntime
     LUA_AVAILABLE = True
-except ImportError:
+else:
     LUA_AVAILABLE = False
     LuaRuntime = None
-    lupa = None
 
 
-@dataclass
-class MonsterTemplate:
+class _DictCached:
+    """Memoizes to_dict(); any attribute assignment drops the cached dict.
+
+    In-place edits of list fields must call _invalidate(). Each caller gets
+    its own copy of the cached dict, so editing it leaves the cache intact;
+    list fields are the record's own lists, as with an uncached dict.
+    Subclasses provide _build_dict().
+    """
+
+    __slots__ = ("_dict_cache",)
+
+    _dict_cache: Optional[dict]
+    _build_dict: Callable[[], dict]
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Any:
+        # Start empty before __init__ assigns the fields, so __setattr__
+        # can check the slot without it ever being unset
+        self = object.__new__(cls)
+        object.__setattr__(self, "_dict_cache", None)
+        return self
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if self._dict_cache is not None:
+            object.__setattr__(self, "_dict_cache", None)
+
+    def _invalidate(self) -> None:
+        object.__setattr__(self, "_dict_cache", None)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        cached = self._dict_cache
+        if cached is None:
+            cached = self._build_dict()
+            object.__setattr__(self, "_dict_cache", cached)
+        return self._copy_dict(cached)
+
+    @staticmethod
+    def _copy_dict(cached: dict) -> dict:
+        return dict(cached)
+
+
+@dataclass(slots=True, eq=False)
+class MonsterTemplate(_DictCached):
     """Template for generating monster entities."""
 
     name: str
@@ -42,8 +121,7 @@ class MonsterTemplate:
     description: str = ""
     difficulty_factor: float = 1.0
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
+    def _build_dict(self) -> dict:
         return {
             "name": self.name,
             "base_hp": self.base_hp,
@@ -63,7 +141,55 @@ class MonsterTemplate:
         }
 
 
-@dataclass
+# Numeric MonsterTemplate fields accepted by LuaEngine.filter_monsters
+MONSTER_STAT_FIELDS = (
+    "base_hp", "base_attack", "base_defense", "base_mp", "speed",
+    "critical", "evasion", "luck", "experience", "difficulty_factor",
+)
+
+
+# (slot name, JSON keys in order of preference, default) for JSON monsters;
+# a default of `list` means a fresh empty list per monster
+_MONSTER_JSON_FIELDS = (
+    ("base_hp", ("hp", "base_hp"), 50),
+    ("base_attack", ("attack", "base_attack"), 10),
+    ("base_defense", ("defense", "base_defense"), 5),
+    ("base_mp", ("mp", "base_mp"), 0),
+    ("speed", ("speed",), 10),
+    ("critical", ("critical",), 10),
+    ("evasion", ("evasion",), 5),
+    ("luck", ("luck",), 5),
+    ("experience", ("experience",), 20),
+    ("skills", ("skills",), list),
+    ("drop_table", ("drop_table",), None),
+    ("theme", ("theme",), "default"),
+    ("description", ("description",), ""),
+    ("difficulty_factor", ("difficulty_factor",), 1.0),
+)
+
+
+def _monster_from_json(name: str, info: dict) -> MonsterTemplate:
+    """Build a MonsterTemplate from a JSON entry.
+
+    Writes the slots with object.__setattr__, skipping the keyword
+    __init__ and the __setattr__ cache check for each of the fifteen
+    fields.
+    """
+    set_slot = object.__setattr__
+    monster = MonsterTemplate.__new__(MonsterTemplate)
+    set_slot(monster, "name", name)
+    for attr, keys, default in _MONSTER_JSON_FIELDS:
+        for key in keys:
+            if key in info:
+                value = info[key]
+                break
+        else:
+            value = default() if default is list else default
+        set_slot(monster, attr, value)
+    return monster
+
+
+@dataclass(slots=True, eq=False)
 class DropEntry:
     """Single entry in a drop table."""
 
@@ -74,16 +200,15 @@ class DropEntry:
     conditions: list[str] = field(default_factory=list)  # e.g., ["boss", "rare_only"]
 
 
-@dataclass
-class DropTable:
+@dataclass(slots=True, eq=False)
+class DropTable(_DictCached):
     """Drop table for monsters."""
 
     name: str
     entries: list[DropEntry] = field(default_factory=list)
     guaranteed: list[DropEntry] = field(default_factory=list)  # Always drop
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
+    def _build_dict(self) -> dict:
         return {
             "name": self.name,
             "entries": [
@@ -105,9 +230,18 @@ class DropTable:
             ],
         }
 
+    @staticmethod
+    def _copy_dict(cached: dict) -> dict:
+        # Entries are dicts built here, not record fields; copy them too
+        return {
+            "name": cached["name"],
+            "entries": [dict(e) for e in cached["entries"]],
+            "guaranteed": [dict(e) for e in cached["guaranteed"]],
+        }
+
 
-@dataclass
-class Theme:
+@dataclass(slots=True, eq=False)
+class Theme(_DictCached):
     """Game theme configuration."""
 
     id: str
@@ -119,8 +253,7 @@ class Theme:
     item_prefixes: list[str] = field(default_factory=list)
     commit_messages: list[str] = field(default_factory=list)
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
+    def _build_dict(self) -> dict:
         return {
             "id": self.id,
             "name": self.name,
@@ -136,24 +269,51 @@ class Theme:
 class LuaEngine:
     """Lua scripting engine for game content."""
 
-    def __init__(self, content_dir: Optional[str] = None):
+    # lupa backend module in use (e.g. "lupa.luajit21"), None without Lua
+    LUA_IMPL: Optional[str] = LUA_BACKEND
+
+    def __init__(
+        self,
+        content_dir: Optional[str] = None,
+        bytecode_cache_dir: Optional[Path | str] = None,
+    ):
         """Initialize the Lua engine.
 
         Args:
             content_dir: Directory for Lua content scripts
+            bytecode_cache_dir: Directory for compiled chunk bytecode
         """
         self.content_dir = Path(content_dir) if content_dir else None
         
+        if bytecode_cache_dir is None:
+            env_cache_dir = os.getenv("GIT_DUNGEON_LUA_CACHE_DIR")
+            if env_cache_dir:
+                bytecode_cache_dir = Path(env_cache_dir)
+            else:
+                bytecode_cache_dir = Path.home() / ".cache" / "git-dungeon" / "lua"
+        self.bytecode_cache_dir = Path(bytecode_cache_dir)
+        
+        # Compiled chunks by resolved path, with the (mtime_ns, size) stamp
+        # of the source they were compiled from
+        self._chunk_cache: dict[str, tuple[bytes, Any]] = {}
+        
         # Content storage
         self.monsters: dict[str, MonsterTemplate] = {}
         self.drop_tables: dict[str, DropTable] = {}
         self.themes: dict[str, Theme] = {}
         
+        # Registered monster names in registration order
+        self._monster_names: list[str] = []
+        
         # Lua runtime (only if lupa is available)
         self.lua: Optional[Any] = None
         if LUA_AVAILABLE and LuaRuntime:
             try:
-                self.lua = LuaRuntime(unpack_returned_tuples=True)
+                self.lua = LuaRuntime(
+                    unpack_returned_tuples=True,
+                    encoding="utf-8",
+                    register_eval=False,
+                )
                 self._setup_apis()
             except Exception as e:
                 logger.warning(f"Failed to initialize Lua runtime: {e}")
@@ -164,7 +324,9 @@ class LuaEngine:
         # Built-in content
         self._setup_builtins()
         
-        logger.info(f"LuaEngine initialized (Lua available: {LUA_AVAILABLE})")
+        logger.info(
+            f"LuaEngine initialized (Lua available: {LUA_AVAILABLE}, backend: {self.LUA_IMPL})"
+        )
 
     def _setup_builtins(self) -> None:
         """Set up built-in content."""
@@ -190,23 +352,38 @@ class LuaEngine:
         if self.lua is None:
             return
             
+        lua_globals = self.lua.globals()
+        # API namespaces are bound once as native Lua tables, so a lookup such
+        # as Monster.get stays inside Lua instead of calling back into a
+        # wrapped Python dict on every access.
+        table_from = self.lua.table_from
+        
         # Monster API
-        self.lua.globals()["Monster"] = self._create_monster_api()
+        lua_globals["Monster"] = table_from(self._create_monster_api())
         
         # DropTable API
-        self.lua.globals()["DropTable"] = self._create_droptable_api()
+        lua_globals["DropTable"] = table_from(self._create_droptable_api())
         
         # Theme API
-        self.lua.globals()["Theme"] = self._create_theme_api()
+        lua_globals["Theme"] = table_from(self._create_theme_api())
         
         # Utility functions
-        self.lua.globals()["log"] = self._log_function
-        self.lua.globals()["print"] = self._log_function
+        lua_globals["log"] = self._log_function
+        lua_globals["print"] = self._log_function
+        
+        # Chunk compilation helpers; string.dump output is binary, so it is
+        # hex-encoded on the Lua side to survive the utf-8 string bridge.
+        self._lua_load = self.lua.eval("load")
+        self._lua_dump_hex = self.lua.eval(
+            "function(f) return (string.dump(f):gsub('.', "
+            "function(c) return string.format('%02x', c:byte()) end)) end"
+        )
 
     def _log_function(self, *args) -> None:
         """Log function for Lua scripts."""
-        message = " ".join(str(arg) for arg in args)
-        logger.debug(f"[Lua] {message}")
+        # Scripts print freely; skip the join when debug output is off.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[Lua] %s", " ".join(str(arg) for arg in args))
 
     def _create_monster_api(self) -> dict:
         """Create Monster API for Lua scripts."""
@@ -234,8 +411,8 @@ class LuaEngine:
                 difficulty_factor=data.get("difficulty_factor", 1.0),
             )
             
-            self.monsters[name] = monster
-            logger.info(f"[Lua] Defined monster: {name}")
+            self.add_monster(monster)
+            logger.info("[Lua] Defined monster: %s", name)
             return name
 
         def get(name: str) -> Optional[dict]:
@@ -249,10 +426,13 @@ class LuaEngine:
 
         def random() -> Optional[dict]:
             """Get a random monster."""
-            if not self.monsters:
+            # Sample the registration-order name list kept by add_monster
+            # instead of copying the registry keys on every call.
+            names = self._monster_names
+            if not names:
                 return None
             import random as random_module
-            name = random_module.choice(list(self.monsters.keys()))
+            name = names[random_module.randrange(len(names))]
             return self.monsters[name].to_dict()
 
         api["define"] = define
@@ -278,8 +458,8 @@ class LuaEngine:
                     max_quantity=entry.get("max_quantity", 1),
                 ))
             
-            self.drop_tables[name] = drop_table
-            logger.info(f"[Lua] Defined drop table: {name}")
+            self.drop_tables[sys.intern(name)] = drop_table
+            logger.info("[Lua] Defined drop table: %s", name)
             return name
 
         def add_guaranteed(name: str, item: str, quantity: int = 1) -> bool:
@@ -293,6 +473,7 @@ class LuaEngine:
                 min_quantity=quantity,
                 max_quantity=quantity,
             ))
+            table._invalidate()
             return True
 
         def get(name: str) -> Optional[dict]:
@@ -330,8 +511,8 @@ class LuaEngine:
                 commit_messages=data.get("commit_messages", []),
             )
             
-            self.themes[theme_id] = theme
-            logger.info(f"[Lua] Defined theme: {theme_id}")
+            self.themes[sys.intern(theme_id)] = theme
+            logger.info("[Lua] Defined theme: %s", theme_id)
             return theme_id
 
         def get(theme_id: str) -> Optional[dict]:
@@ -396,71 +577,128 @@ class LuaEngine:
             return False, f"Lua not available for: {file_path}"
         
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                code = f.read()
-            
-            success, result = self.execute(code)
-            if success:
-                return True, f"Loaded: {path.name}"
-            else:
-                return False, f"Error: {result}"
-        except Exception as e:
+            chunk, error = self._compile_file(path)
+        except (OSError, UnicodeDecodeError) as e:
             return False, f"Failed to load: {e}"
+        if chunk is None:
+            return False, f"Error: {error}"
+        
+        try:
+            chunk()
+        except Exception as e:
+            logger.error(f"[Lua] Execution error: {e}")
+            return False, f"Error: {e}"
+        return True, f"Loaded: {path.name}"
+
+    def _compile_file(self, path: Path) -> tuple[Any, Optional[str]]:
+        """Compile a Lua file once, reusing memory and on-disk bytecode.
+
+        Returns:
+            Tuple of (chunk, error); chunk is None on a syntax error
+        """
+        stat = path.stat()
+        resolved = str(path.resolve())
+        stamp = b"%d %d\n" % (stat.st_mtime_ns, stat.st_size)
+        cached = self._chunk_cache.get(resolved)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], None
+        
+        # One bytecode file per script; the stamp header marks it stale
+        # once the source changes, and the next compile overwrites it
+        digest = hashlib.sha1(f"{self.LUA_IMPL}:{resolved}".encode("utf-8")).hexdigest()
+        bytecode_path = self.bytecode_cache_dir / f"{digest}.luac"
+        chunk = None
+        try:
+            data = bytecode_path.read_bytes()
+        except OSError:
+            data = b""
+        if data.startswith(stamp):
+            chunk, _ = self._load_chunk(data[len(stamp):], path.name)
+        
+        if chunk is None:
+            code = path.read_text(encoding="utf-8")
+            chunk, error = self._load_chunk(code, path.name)
+            if chunk is None:
+                return None, error
+            self._store_bytecode(bytecode_path, stamp, chunk)
+        
+        self._chunk_cache[resolved] = (stamp, chunk)
+        return chunk, None
+
+    def _load_chunk(self, source: str | bytes, name: str) -> tuple[Any, Optional[str]]:
+        """Compile source or bytecode with Lua's load()."""
+        result = self._lua_load(source, f"@{name}")
+        if isinstance(result, tuple):  # load() returned nil, message
+            return None, result[1]
+        return result, None
+
+    def _store_bytecode(self, bytecode_path: Path, stamp: bytes, chunk: Any) -> None:
+        """Persist a compiled chunk after its source stamp so later runs skip parsing."""
+        tmp_path = bytecode_path.with_suffix(".tmp")
+        try:
+            bytecode_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(stamp + bytes.fromhex(self._lua_dump_hex(chunk)))
+            os.replace(tmp_path, bytecode_path)
+        except OSError as e:
+            logger.debug("[Lua] Could not cache bytecode %s: %s", bytecode_path, e)
 
     def _load_json_file(self, path: Path) -> tuple[bool, str]:
         """Load content from a JSON file (fallback when Lua unavailable)."""
+        return self._apply_json_content(path, _decode_json(path))
+
+    def _apply_json_content(self, path: Path, decoded: tuple[Any, Optional[Exception]]) -> tuple[bool, str]:
+        """Register content from an already decoded JSON file."""
+        data, error = decoded
+        if error is not None:
+            return False, f"Failed to load JSON: {error}"
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            # Determine content type from structure
-            # Check if it's a monster file
-            if isinstance(data, dict):
-                first_key = next(iter(data.keys()), "")
-                first_value = data.get(first_key, {})
-                
-                # Detect type based on content structure
-                if isinstance(first_value, dict):
-                    # Check for monster (has hp, base_hp, or attack)
-                    if "hp" in first_value or "base_hp" in first_value or "attack" in first_value:
-                        self._parse_json_monsters(data)
-                    # Check for drop table (has entries)
-                    elif "entries" in first_value or "guaranteed" in first_value:
-                        self._parse_json_droptables(data)
-                    # Check for theme (has monster_prefixes or color_scheme)
-                    elif "monster_prefixes" in first_value or "color_scheme" in first_value:
-                        self._parse_json_themes(data)
+            if data is _STREAMED:
+                self._stream_json_file(path)
+            elif isinstance(data, dict):
+                parse = self._json_content_parser(next(iter(data.values()), None))
+                if parse is not None:
+                    parse(data.items())
             
             return True, f"Loaded JSON: {path.name}"
         except Exception as e:
             return False, f"Failed to load JSON: {e}"
 
-    def _parse_json_monsters(self, data: dict) -> None:
-        """Parse monsters from JSON data."""
-        for name, info in data.items():
+    def _stream_json_file(self, path: Path) -> None:
+        """Register a large JSON file entry by entry without building the dict."""
+        with open(path, "rb") as f:
+            items = ijson.kvitems(f, "", use_float=True)
+            first = next(items, None)
+            if first is None:
+                return
+            parse = self._json_content_parser(first[1])
+            if parse is not None:
+                parse(chain((first,), items))
+
+    def _json_content_parser(self, first_value: Any) -> Optional[Callable[[Iterable[tuple[str, Any]]], None]]:
+        """Pick the parser for a JSON file from the shape of its first entry."""
+        # Detect type based on content structure
+        if not isinstance(first_value, dict):
+            return None
+        # Check for monster (has hp, base_hp, or attack)
+        if "hp" in first_value or "base_hp" in first_value or "attack" in first_value:
+            return self._parse_json_monsters
+        # Check for drop table (has entries)
+        if "entries" in first_value or "guaranteed" in first_value:
+            return self._parse_json_droptables
+        # Check for theme (has monster_prefixes or color_scheme)
+        if "monster_prefixes" in first_value or "color_scheme" in first_value:
+            return self._parse_json_themes
+        return None
+
+    def _parse_json_monsters(self, items: Iterable[tuple[str, Any]]) -> None:
+        """Parse monsters from JSON (name, info) pairs."""
+        for name, info in items:
             if isinstance(info, dict):
-                monster = MonsterTemplate(
-                    name=name,
-                    base_hp=info.get("hp", info.get("base_hp", 50)),  # type: ignore[arg-type]
-                    base_attack=info.get("attack", info.get("base_attack", 10)),  # type: ignore[arg-type]
-                    base_defense=info.get("defense", info.get("base_defense", 5)),  # type: ignore[arg-type]
-                    base_mp=info.get("mp", info.get("base_mp", 0)),  # type: ignore[arg-type]
-                    speed=info.get("speed", 10),
-                    critical=info.get("critical", 10),
-                    evasion=info.get("evasion", 5),
-                    luck=info.get("luck", 5),
-                    experience=info.get("experience", 20),
-                    skills=info.get("skills", []),
-                    drop_table=info.get("drop_table"),
-                    theme=info.get("theme", "default"),
-                    description=info.get("description", ""),
-                    difficulty_factor=info.get("difficulty_factor", 1.0),
-                )
-                self.monsters[name] = monster
+                self.add_monster(_monster_from_json(name, info))
 
-    def _parse_json_droptables(self, data: dict) -> None:
-        """Parse drop tables from JSON data."""
-        for name, info in data.items():
+    def _parse_json_droptables(self, items: Iterable[tuple[str, Any]]) -> None:
+        """Parse drop tables from JSON (name, info) pairs."""
+        for name, info in items:
             if isinstance(info, dict):
                 table = DropTable(name=name)
                 for entry in info.get("entries", []):
@@ -470,11 +708,11 @@ class LuaEngine:
                         min_quantity=entry.get("min_quantity", 1),
                         max_quantity=entry.get("max_quantity", 1),
                     ))
-                self.drop_tables[name] = table
+                self.drop_tables[sys.intern(name)] = table
 
-    def _parse_json_themes(self, data: dict) -> None:
-        """Parse themes from JSON data."""
-        for theme_id, info in data.items():
+    def _parse_json_themes(self, items: Iterable[tuple[str, Any]]) -> None:
+        """Parse themes from JSON (theme_id, info) pairs."""
+        for theme_id, info in items:
             if isinstance(info, dict):
                 theme = Theme(
                     id=theme_id,
@@ -486,7 +724,7 @@ class LuaEngine:
                     item_prefixes=info.get("item_prefixes", []),
                     commit_messages=info.get("commit_messages", []),
                 )
-                self.themes[theme_id] = theme
+                self.themes[sys.intern(theme_id)] = theme
 
     def load_directory(self, directory: str) -> tuple[int, int]:
         """Load all content files from a directory (Lua and JSON).
@@ -501,39 +739,77 @@ class LuaEngine:
         if not dir_path.exists():
             return 0, 0
         
-        loaded = 0
-        failed = 0
+        lua_files = sorted(dir_path.glob("*.lua"))
+        json_files = sorted(dir_path.glob("*.json"))
+        results = []
         
-        # Load Lua files
-        for lua_file in dir_path.glob("*.lua"):
-            success, _ = self.load_file(str(lua_file))
-            if success:
-                loaded += 1
-            else:
-                failed += 1
+        # Load Lua files (one Lua state, so execution stays serial)
+        for lua_file in lua_files:
+            results.append(self.load_file(str(lua_file))[0])
         
-        # Load JSON files
-        for json_file in dir_path.glob("*.json"):
-            success, _ = self.load_file(str(json_file))
-            if success:
-                loaded += 1
-            else:
-                failed += 1
+        # Load JSON files: reading and decoding release the GIL and run on a
+        # pool; registration stays on this thread in file-name order.
+        if json_files:
+            with ThreadPoolExecutor(max_workers=min(8, len(json_files))) as pool:
+                decoded = list(pool.map(_decode_json, json_files))
+            for json_file, content in zip(json_files, decoded):
+                results.append(self._apply_json_content(json_file, content)[0])
+        
+        loaded = results.count(True)
+        failed = len(results) - loaded
         
         logger.info(f"Loaded {loaded} content files, {failed} failed")
         return loaded, failed
 
+    def add_monster(self, monster: MonsterTemplate) -> None:
+        """Register a monster template."""
+        # Names come from Lua/JSON strings; interning makes later lookups
+        # with the same name a pointer compare.
+        name = monster.name = sys.intern(monster.name)
+        if name not in self.monsters:
+            self._monster_names.append(name)
+        self.monsters[name] = monster
+
+    def filter_monsters(self, **minimums: float) -> list[str]:
+        """Names of registered monsters whose stats meet every minimum.
+
+        Args:
+            **minimums: Stat name to inclusive lower bound, e.g. base_attack=20
+
+        Returns:
+            Matching monster names in registration order
+        """
+        unknown = set(minimums) - set(MONSTER_STAT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown monster stats: {sorted(unknown)}")
+        
+        checks = tuple(minimums.items())
+        return [
+            name
+            for name, monster in self.monsters.items()
+            if all(getattr(monster, stat) >= minimum for stat, minimum in checks)
+        ]
+
     def get_monster(self, name: str) -> Optional[MonsterTemplate]:
         """Get a monster template by name."""
-        return self.monsters.get(name)
+        try:
+            return self.monsters[name]
+        except KeyError:
+            return None
 
     def get_drop_table(self, name: str) -> Optional[DropTable]:
         """Get a drop table by name."""
-        return self.drop_tables.get(name)
+        try:
+            return self.drop_tables[name]
+        except KeyError:
+            return None
 
     def get_theme(self, theme_id: str) -> Optional[Theme]:
         """Get a theme by ID."""
-        return self.themes.get(theme_id)
+        try:
+            return self.themes[theme_id]
+        except KeyError:
+            return None
 
     def get_all_content(self) -> dict:
         """Get all loaded content as a dictionary."""
@@ -559,22 +835,49 @@ class LuaEngine:
         
         for category, data in content.items():
             file_path = output_path / f"{category}.json"
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson:
+                file_path.write_bytes(
+                    orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                with open(file_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
         
         logger.info(f"Exported content to {output_dir}")
         return True
 
 
+def _decode_json(path: Path) -> tuple[Any, Optional[Exception]]:
+    """Read and decode a JSON file, returning (data, error).
+
+    Files of JSON_STREAM_MIN_BYTES or more are left for _stream_json_file
+    when ijson is installed.
+    """
+    try:
+        if ijson is not None and path.stat().st_size >= JSON_STREAM_MIN_BYTES:
+            return _STREAMED, None
+        return _read_json(path), None
+    except Exception as e:
+        return None, e
+
+
+def _read_json(path: Path) -> Any:
+    """Decode a JSON file, straight from a read-only mapping with orjson."""
+    if orjson is None:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
 def parse_lua_table(lua_table: Any) -> dict:
     """Convert a Lua table to a Python dictionary."""
     if lupa is None:
         return {}
-    result = {}
-    for key, value in lua_table.items():
-        if isinstance(value, lupa.LuaTable):
-            value = parse_lua_table(value)
-        result[key] = value
+    result: dict = {}
+    _convert_nested_tables([(lua_table, result)], {repr(lua_table): result})
     return result
 
 
@@ -583,8 +886,42 @@ def lua_table_to_list(lua_table: Any) -> list:
     if lupa is None:
         return []
     result = []
+    pending: list = []
+    seen: dict = {}
     for value in lua_table.values():
-        if isinstance(value, lupa.LuaTable):
-            value = parse_lua_table(value)
+        if lupa.lua_type(value) == "table":
+            value = _visit_table(value, pending, seen)
         result.append(value)
+    _convert_nested_tables(pending, seen)
     return result
+
+
+def _visit_table(lua_table: Any, pending: list, seen: dict) -> dict:
+    """Return the dict for lua_table, queueing it the first time it is seen.
+
+    lupa hands out a fresh wrapper on every access, so tables are keyed by
+    the address in their repr; a table reached twice (or through itself)
+    maps to the same dict instead of being walked again.
+    """
+    ident = repr(lua_table)
+    out = seen.get(ident)
+    if out is None:
+        out = seen[ident] = {}
+        pending.append((lua_table, out))
+    return out
+
+
+def _convert_nested_tables(pending: list, seen: dict) -> None:
+    """Fill (lua_table, dict) pairs with an explicit stack instead of recursion.
+
+    Deep definition trees would otherwise cost a Python frame per level and
+    can hit the recursion limit. Self-referencing tables become
+    self-referencing dicts.
+    """
+    lua_type = lupa.lua_type
+    while pending:
+        lua_table, out = pending.pop()
+        for key, value in lua_table.items():
+            if lua_type(value) == "table":
+                value = _visit_table(value, pending, seen)
+            out[key] = value
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import gc
+import logging
 import os
 import time
 from contextlib import contextmanager
@@ -14,6 +15,20 @@ from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# psutil handle for this process, created on first use
+_process = None
+
+
+def _current_process():
+    """Return a cached psutil.Process for the running (possibly forked) process."""
+    global _process
+    if _process is None or _process.pid != os.getpid():
+        import psutil
+
+        _process = psutil.Process()
+        _process.cpu_percent(interval=None)  # baseline for non-blocking reads
+    return _process
+
 
 @dataclass
 class ResourceStats:
@@ -40,18 +55,17 @@ class ResourceManager:
         self._active_operations: list[str] = []
         self._operation_counts: dict[str, int] = {}
         self._start_time = time.time()
+        self._last_gc_time = 0.0
 
     @property
     def stats(self) -> ResourceStats:
         """Get current resource statistics."""
-        import psutil
-
-        process = psutil.Process(os.getpid())
+        process = _current_process()
         memory_info = process.memory_info()
 
         return ResourceStats(
             memory_mb=memory_info.rss / (1024 * 1024),
-            cpu_percent=process.cpu_percent(),
+            cpu_percent=process.cpu_percent(interval=None),
             active_operations=len(self._active_operations),
             cached_items=self._operation_counts.get("cache_hits", 0),
             last_gc_time=self._last_gc_time,
@@ -133,7 +147,8 @@ class ResourceManager:
             value: Metric value
         """
         # In a full implementation, this would send to a metrics system
-        logger.debug(f"Metric: {metric} = {value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Metric: %s = %s", metric, value)
 
     def get_uptime(self) -> float:
         """Get uptime in seconds."""
@@ -160,18 +175,20 @@ class ChunkedLoader:
         self,
         chunk_size: Optional[int] = None,
         on_progress: Optional[Callable[[float], None]] = None,
+        config: Optional[GameConfig] = None,
     ):
         """Initialize chunked loader.
 
         Args:
             chunk_size: Size of each chunk
             on_progress: Progress callback (0.0 to 1.0)
+            config: Game configuration; its max_memory_mb replaces the
+                default 500MB limit
         """
-        import psutil
-
         self.chunk_size = chunk_size or 100
         self.on_progress = on_progress
-        self.psutil = psutil
+        limit_mb = config.max_memory_mb if config else 500
+        self._memory_limit = limit_mb * 1024 * 1024  # Convert to bytes
 
     def load_large_dataset(
         self,
@@ -196,11 +213,11 @@ class ChunkedLoader:
             return results
 
         for i, item in enumerate(data_source[:total_items]):
-            # Check memory before processing
-            process = self.psutil.Process(os.getpid())
-            if process.memory_info().rss > 500 * 1024 * 1024:  # 500MB limit
-                logger.warning("Memory limit approaching, stopping chunked load")
-                break
+            # Check memory before each chunk
+            if i % self.chunk_size == 0:
+                if _current_process().memory_info().rss > self._memory_limit:
+                    logger.warning("Memory limit approaching, stopping chunked load")
+                    break
 
             try:
                 result = process_item(item)
@@ -0,0 +1,38 @@
+"""
+Parser for OptimizedGitParser's `git log --numstat` output.
+
+Kept in its own module so it can be compiled on its own: the code is plain
+Python and also compiles unchanged with Cython (``make cython-numstat``);
+the built extension then shadows this file.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+
+def parse_git_log(output: str) -> Iterator[tuple]:
+    """Parse log records followed by their numstat lines.
+
+    Each record is ``\\x01`` + hexsha, author name, author email, committer
+    ISO date and raw message separated by ``\\x1f`` and ended by ``\\x1e``,
+    then one ``added<TAB>deleted<TAB>path`` line per file. Yields
+    (hexsha, author_name, author_email, committed_iso, message,
+    additions, deletions, files_changed) tuples.
+    """
+    for record in output.split('\x01')[1:]:
+        header, _, numstat = record.partition('\x1e')
+        hexsha, author_name, author_email, committed, message = header.split('\x1f', 4)
+        additions = deletions = files_changed = 0
+        for line in numstat.splitlines():
+            if not line:
+                continue
+            added, deleted, _ = line.split('\t', 2)
+            files_changed += 1
+            if added != '-':  # binary files have no line counts
+                additions += int(added)
+                deletions += int(deleted)
+        yield (
+            hexsha, author_name, author_email, committed, message,
+            additions, deletions, files_changed,
+        )
@@ -2,27 +2,34 @@
 """
 Optimized Components for Git Dungeon
 性能优化的组件实现
+
+The module is plain Python and also compiles unchanged with Cython
+(``make cython-components``); the built extension then shadows this file.
 """
 
 from __future__ import annotations
 from typing import Optional
-from enum import Enum
+from enum import IntEnum
 
 
 # ============================================================
 # 1. 使用 NamedTuple 的轻量级 Stat
 # ============================================================
 
-class StatType(Enum):
-    """Character stat types."""
-    HP = "hp"
-    MP = "mp"
-    ATTACK = "attack"
-    DEFENSE = "defense"
-    SPEED = "speed"
-    CRITICAL = "critical"
-    EVASION = "evasion"
-    LUCK = "luck"
+class StatType(IntEnum):
+    """Character stat types; values index CharacterStats.value()."""
+    HP = 0
+    MP = 1
+    ATTACK = 2
+    DEFENSE = 3
+    SPEED = 4
+    CRITICAL = 5
+    EVASION = 6
+    LUCK = 7
+
+
+# CharacterStats slot name for each StatType, in StatType order
+_STAT_NAMES = tuple(stat.name.lower() for stat in StatType)
 
 
 # 使用 NamedTuple 的轻量级 Stat (比 dataclass 快 2-3 倍)
@@ -57,7 +64,10 @@ class Stat:
 # ============================================================
 
 class CharacterStats:
-    """Optimized character stats container."""
+    """Optimized character stats container.
+    
+    Each stat is a Stat held in a slot; value() reads one by StatType.
+    """
     
     __slots__ = ('hp', 'mp', 'attack', 'defense', 'speed', 'critical', 'evasion', 'luck')
     
@@ -81,6 +91,10 @@ class CharacterStats:
         self.evasion = Stat(evasion)
         self.luck = Stat(luck)
     
+    def value(self, stat: StatType) -> int:
+        """Effective value of the stat named by a StatType."""
+        return getattr(self, _STAT_NAMES[stat]).value
+    
     def copy(self) -> 'CharacterStats':
         """Create a deep copy."""
         return CharacterStats(
@@ -104,6 +118,15 @@ class CharacterStats:
             + self.speed.value
         )
     
+    def power_level(self) -> int:
+        """Get overall power level (hp counts at one tenth)."""
+        return (
+            self.hp.value // 10
+            + self.attack.value
+            + self.defense.value
+            + self.speed.value
+        )
+    
     def reset(self) -> None:
         """Reset all modifiers."""
         self.hp.reset_modifiers()
@@ -120,21 +143,21 @@ class CharacterStats:
 # 3. 优化的 CharacterComponent (不继承 Component)
 # ============================================================
 
-class CharacterType(Enum):
+class CharacterType(IntEnum):
     """Type of character."""
-    PLAYER = "player"
-    MONSTER = "monster"
-    NPC = "npc"
+    PLAYER = 0
+    MONSTER = 1
+    NPC = 2
 
 
-class StatusEffectType(Enum):
+class StatusEffectType(IntEnum):
     """Status effect types."""
-    POISON = "poison"
-    BURN = "burn"
-    FREEZE = "freeze"
-    PARALYSIS = "paralysis"
-    BUFF = "buff"
-    DEBUFF = "debuff"
+    POISON = 0
+    BURN = 1
+    FREEZE = 2
+    PARALYSIS = 3
+    BUFF = 4
+    DEBUFF = 5
 
 
 class StatusEffect:
@@ -155,6 +178,10 @@ class StatusEffect:
         self.description = description
 
 
+# Experience thresholds (level^2 * 100) precomputed for the first 1024 levels
+_EXP_TABLE = tuple(level * level * 100 for level in range(1024))
+
+
 class OptimizedCharacter:
     """Optimized standalone character class (no inheritance)."""
     
@@ -186,7 +213,10 @@ class OptimizedCharacter:
     
     def _calculate_exp_needed(self) -> int:
         """Calculate experience needed for next level."""
-        return self.level * self.level * 100
+        level = self.level
+        if 0 <= level < 1024:
+            return _EXP_TABLE[level]
+        return level * level * 100
     
     def initialize_stats(
         self,
@@ -250,12 +280,7 @@ class OptimizedCharacter:
         if not self.stats:
             return 0
         
-        return (
-            self.stats.hp.value // 10 +
-            self.stats.attack.value +
-            self.stats.defense.value +
-            self.stats.speed.value
-        )
+        return self.stats.power_level()
     
     def get_stat_summary(self) -> dict:
         """Get summary of key stats."""
@@ -290,6 +315,13 @@ class CharacterPool:
     _pool: list[OptimizedCharacter] = []
     _max_size: int = 100
     
+    @classmethod
+    def reserve(cls, count: int) -> None:
+        """Pre-create characters so a wave of ``count`` spawns never allocates."""
+        cls._max_size = max(cls._max_size, count)
+        for _ in range(count - len(cls._pool)):
+            cls._pool.append(OptimizedCharacter(CharacterType.MONSTER, ""))
+    
     @classmethod
     def get(cls, char_type: CharacterType, name: str) -> OptimizedCharacter:
         """Get a character from pool or create new."""
@@ -304,7 +336,9 @@ class CharacterPool:
             char.current_hp = 0
             char.current_mp = 0
             char.is_alive = True
-            char.status_effects.clear()
+            # Keep the same list object; clearing an empty list is skipped
+            if char.status_effects:
+                char.status_effects.clear()
             char._last_level_up = 1
             char._total_exp_gained = 0
             return char
@@ -4,22 +4,72 @@ Optimized Git Parser
 使用缓存和批量操作优化 Git 解析性能
 """
 
+import json
 import os
+import re
 import subprocess
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
 from pathlib import Path
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime
 import logging
-
-# 添加项目路径
 import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config import GameConfig
 from git import Repo, InvalidGitRepositoryError
 
+from git_dungeon.config import GameConfig
+
+from git_dungeon.core.numstat_parser import parse_git_log
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import pygit2
+except ImportError:  # optional; parse_commit uses GitPython's commit.stats otherwise
+    pygit2 = None
+
 logger = logging.getLogger(__name__)
 
+COMMIT_CACHE_VERSION = 1
+# Persisted histories kept per repository (least recently used are evicted)
+COMMIT_CACHE_ENTRIES = 10
+# History is split into slices of at least this many commits, one
+# `git log --numstat` process per slice, up to GIT_LOG_WORKERS at once
+PARALLEL_LOG_MIN_COMMITS = 2000
+GIT_LOG_WORKERS = 8
+
+
+# git log record: \x01 starts a commit, \x1f separates header fields and
+# \x1e ends the raw message; --numstat lines follow the header.
+_LOG_FORMAT = '%x01%H%x1f%an%x1f%ae%x1f%cI%x1f%B%x1e'
+
+# "N files changed, N insertions(+), N deletions(-)" from --shortstat
+_SHORTSTAT_RE = re.compile(r'(\d+) insertion|(\d+) deletion')
+
+
+# Conventional-commit prefixes (matched with startswith semantics) -> creature
+_CREATURE_NAMES = {
+    "feat": "Feature",
+    "fix": "Bug",
+    "docs": "Documentation",
+    "refactor": "Refactor",
+    "test": "Test",
+    "chore": "Chore",
+    "style": "Style",
+    "perf": "Performance",
+    "merge": "Merge",
+    "revert": "Revert",
+    "ci": "CI",
+}
+_CREATURE_PREFIX = re.compile("|".join(_CREATURE_NAMES))
+_CREATURE_PREFIX_LEN = max(map(len, _CREATURE_NAMES))
+
 
 class GitError(Exception):
     """Git-related error."""
@@ -31,9 +81,9 @@ class ResourceLimitError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommitInfo:
-    """Information about a git commit."""
+    """Information about a git commit (immutable, slotted)."""
     hexsha: str
     short_sha: str
     message: str
@@ -43,50 +93,80 @@ class CommitInfo:
     additions: int
     deletions: int
     files_changed: int
+    # Derived from message once at construction; read every render frame
+    creature_name: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'creature_name', _creature_name(self.message))
     
     def get_creature_name(self) -> str:
         """Get monster name based on commit message."""
-        msg = self.message.lower()
-        
-        if msg.startswith("feat"):
-            return "Feature"
-        elif msg.startswith("fix"):
-            return "Bug"
-        elif msg.startswith("docs"):
-            return "Documentation"
-        elif msg.startswith("refactor"):
-            return "Refactor"
-        elif msg.startswith("test"):
-            return "Test"
-        elif msg.startswith("chore"):
-            return "Chore"
-        elif msg.startswith("style"):
-            return "Style"
-        elif msg.startswith("perf"):
-            return "Performance"
-        elif msg.startswith("merge"):
-            return "Merge"
-        elif msg.startswith("revert"):
-            return "Revert"
-        elif msg.startswith("ci"):
-            return "CI"
-        elif "(" in msg:
-            return msg.split("(")[0].capitalize()
-        else:
-            return self.message.split()[0].capitalize()
+        return self.creature_name
+
+
+def _creature_name(message: str) -> str:
+    """Monster name for a commit message."""
+    # Only the head of the message can hold a known prefix
+    match = _CREATURE_PREFIX.match(message[:_CREATURE_PREFIX_LEN].lower())
+    if match:
+        return _CREATURE_NAMES[match.group()]
+    
+    msg = message.lower()
+    if "(" in msg:
+        return msg.split("(")[0].capitalize()
+    words = message.split()
+    return words[0].capitalize() if words else "Unknown"
+
+
+
+# Returned by parse_commit for commits that cannot be read; CommitInfo is
+# frozen, so one shared instance is safe and can be checked with `is`.
+_UNKNOWN_COMMIT = CommitInfo(
+    hexsha="0" * 40,
+    short_sha="0" * 8,
+    message="Unknown",
+    author_name="Unknown",
+    author_email="unknown",
+    committed_datetime="",
+    additions=0,
+    deletions=0,
+    files_changed=0,
+)
+
+@dataclass(slots=True)
+class CommitColumns:
+    """Commit history as parallel columns; row i of every column is one commit."""
+    hexsha: list[str] = field(default_factory=list)
+    additions: array = field(default_factory=lambda: array('q'))
+    deletions: array = field(default_factory=lambda: array('q'))
+    files_changed: array = field(default_factory=lambda: array('q'))
+    author_idx: array = field(default_factory=lambda: array('l'))  # index into authors
+    authors: list[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.hexsha)
+    
+    def commits_per_author(self) -> dict[str, int]:
+        """Number of commits by each author."""
+        counts = [0] * len(self.authors)
+        for idx in self.author_idx:
+            counts[idx] += 1
+        return dict(zip(self.authors, counts))
 
 
 class OptimizedGitParser:
     """Optimized Git parser with caching and batch operations."""
     
-    # Class-level cache for Repo objects
-    _repo_cache: dict[str, Repo] = {}
+    # Class-level LRU cache for Repo objects (most recently used last)
+    _repo_cache: OrderedDict[str, Repo] = OrderedDict()
     _max_cache_size: int = 5
     
     def __init__(self, config: Optional[GameConfig] = None):
         self.config = config or GameConfig()
         self._repo: Optional[Repo] = None
+        self._pgrepo: Optional["pygit2.Repository"] = None  # for in-process diff stats
         self._commits_cache: dict[str, list[CommitInfo]] = {}  # path -> commits
+        self._use_disk_cache = True
     
     @classmethod
     def _get_repo(cls, path: str) -> Repo:
@@ -98,9 +178,10 @@ class OptimizedGitParser:
             try:
                 # Verify repo is still valid
                 if cls._repo_cache[path].head.is_valid():
+                    cls._repo_cache.move_to_end(path)
                     return cls._repo_cache[path]
             except Exception:
-                del cls._repo_cache[path]
+                cls._repo_cache.pop(path).close()
         
         # Create new Repo (use search_parent_directories for better detection)
         try:
@@ -114,15 +195,22 @@ class OptimizedGitParser:
                 raise GitError(f"Failed to initialize repository: {e}")
         
         # Add to cache (LRU eviction)
-        if len(cls._repo_cache) >= cls._max_cache_size:
-            # Remove oldest entry
-            cls._repo_cache.pop(next(iter(cls._repo_cache)))
-        
         cls._repo_cache[path] = repo
+        cls._repo_cache.move_to_end(path)
+        while len(cls._repo_cache) > cls._max_cache_size:
+            # Drop the least recently used repo and release its git processes
+            _, evicted = cls._repo_cache.popitem(last=False)
+            evicted.close()
         return repo
     
-    def load_repository(self, path: str) -> None:
-        """Load a Git repository."""
+    def load_repository(self, path: str, use_cache: bool = True) -> None:
+        """Load a Git repository.
+        
+        Args:
+            path: Repository path
+            use_cache: Reuse history persisted for an unchanged HEAD
+        """
+        self._use_disk_cache = use_cache
         try:
             repo_path = Path(path).resolve()
             
@@ -134,6 +222,7 @@ class OptimizedGitParser:
             
             # Use cached Repo
             self._repo = self._get_repo(str(repo_path))
+            self._pgrepo = pygit2.Repository(str(self._repo.git_dir)) if pygit2 else None
             
             # Check repository size
             if self._is_too_large():
@@ -152,11 +241,31 @@ class OptimizedGitParser:
         if self._repo is None:
             return False
         
+        # Counted by git itself (commit-graph aware) instead of materializing
+        # every commit object in Python
         try:
-            total_commits = len(list(self._repo.iter_commits("--all")))
-            return total_commits > self.config.max_commits * 2
-        except Exception:
+            result = self._run_git('rev-list', '--count', '--all', timeout=5)
+        except subprocess.TimeoutExpired:
+            return True  # too big for git to count in time
+        if result.returncode != 0:  # e.g. no commits yet
             return False
+        return int(result.stdout.strip() or 0) > self.config.max_commits * 2
+    
+    def _run_git(
+        self, *args: str, timeout: Optional[float] = None, input: Optional[bytes] = None
+    ) -> subprocess.CompletedProcess:
+        """Run a read-only git command against the loaded repository's object store.
+        
+        --git-dir skips repository discovery and GIT_OPTIONAL_LOCKS=0 keeps git
+        from refreshing the index, so the working tree is never scanned.
+        """
+        return subprocess.run(
+            ['git', '--git-dir', self._repo.git_dir, *args],
+            input=input,
+            capture_output=True,
+            env={**os.environ, 'GIT_OPTIONAL_LOCKS': '0'},
+            timeout=timeout,
+        )
     
     def get_commit_history(
         self,
@@ -172,31 +281,198 @@ class OptimizedGitParser:
         if cache_key in self._commits_cache:
             return self._commits_cache[cache_key]
         
-        # Get commits using iter_items (more reliable)
-        try:
-            commits = list(self._repo.head.commit.iter_items(
-                self._repo,
-                self._repo.head.reference
-            ))
-        except Exception:
-            commits = list(self._repo.iter_commits())
+        # The other orientation may already be parsed; flipping it is cheaper
+        flipped = self._commits_cache.get(f"{self._repo.working_tree_dir}:{limit}:{not reverse}")
+        if flipped is not None:
+            commit_infos = flipped[::-1]
+            self._commits_cache[cache_key] = commit_infos
+            return commit_infos
         
-        # Apply limit
-        if limit:
-            commits = commits[:limit]
+        # A freshly initialized repository has no history yet
+        if not self._repo.head.is_valid():
+            return []
         
-        # Parse commits
-        commit_infos = [self.parse_commit(c) for c in commits]
+        head_sha = self._repo.head.commit.hexsha
+        commit_infos = self._load_commit_cache(head_sha, limit) if self._use_disk_cache else None
+        if commit_infos is None:
+            commit_infos = self._read_git_log(limit)
+            if self._use_disk_cache:
+                self._store_commit_cache(head_sha, limit, commit_infos)
         
-        # Reverse if needed
+        # The list is freshly built and not shared yet, so flip it in place
         if reverse:
-            commit_infos = commit_infos[::-1]
+            commit_infos.reverse()
         
         # Cache result
         self._commits_cache[cache_key] = commit_infos
         
         return commit_infos
     
+    def get_commit_history_soa(self, limit: Optional[int] = None) -> 'CommitColumns':
+        """Get commit history as parallel columns (newest first).
+        
+        Aggregations (sums, per-author counts) then run over flat arrays
+        instead of a list of CommitInfo objects.
+        """
+        if self._repo is None:
+            raise GitError("Repository not loaded")
+        
+        columns = CommitColumns()
+        if not self._repo.head.is_valid():
+            return columns
+        
+        author_index: dict[str, int] = {}
+        for hexsha, author_name, _, _, _, additions, deletions, files_changed in self._iter_git_log(limit):
+            idx = author_index.get(author_name)
+            if idx is None:
+                idx = author_index[author_name] = len(columns.authors)
+                columns.authors.append(author_name)
+            columns.hexsha.append(hexsha)
+            columns.additions.append(additions)
+            columns.deletions.append(deletions)
+            columns.files_changed.append(files_changed)
+            columns.author_idx.append(idx)
+        return columns
+    
+    def _read_git_log(self, limit: Optional[int] = None) -> list[CommitInfo]:
+        """Read history and per-commit line stats with a single `git log`."""
+        return [
+            CommitInfo(
+                hexsha=hexsha,
+                short_sha=hexsha[:8],
+                message=message.strip(),
+                author_name=sys.intern(author_name),
+                author_email=sys.intern(author_email),
+                committed_datetime=str(datetime.fromisoformat(committed)),
+                additions=additions,
+                deletions=deletions,
+                files_changed=files_changed,
+            )
+            for (
+                hexsha, author_name, author_email, committed, message,
+                additions, deletions, files_changed,
+            ) in self._iter_git_log(limit)
+        ]
+    
+    def _iter_git_log(self, limit: Optional[int] = None) -> Iterator[tuple]:
+        """Yield raw (hexsha, author_name, author_email, committed_iso,
+        message, additions, deletions, files_changed) rows from `git log`.
+        
+        Counts match parse_commit(): renames are split into delete + add and
+        merges are diffed against their first parent, as GitPython's
+        commit.stats does.
+        """
+        for output in self._git_log_outputs(limit):
+            yield from self._parse_git_log(output)
+    
+    def _git_log_outputs(self, limit: Optional[int]) -> list[str]:
+        """Run `git log --numstat` over the history, split across workers.
+        
+        The commit list comes from one cheap rev-list; computing the numstat
+        diffs is the expensive part, so long histories are cut into
+        contiguous slices that separate git processes diff in parallel.
+        Outputs are returned in history order.
+        """
+        rev_args = ['rev-list', 'HEAD']
+        if limit:
+            rev_args[1:1] = ['-n', str(limit)]
+        shas = self._check_git(self._run_git(*rev_args), 'rev-list').split()
+        
+        if not shas:
+            return []
+        workers = min(GIT_LOG_WORKERS, os.cpu_count() or 1, -(-len(shas) // PARALLEL_LOG_MIN_COMMITS))
+        size = -(-len(shas) // workers)
+        chunks = [shas[i:i + size] for i in range(0, len(shas), size)]
+        
+        def log_chunk(chunk: list[str]) -> str:
+            result = self._run_git(
+                'log', '--no-walk=unsorted', '--stdin', f'--format={_LOG_FORMAT}', '--numstat',
+                '--no-renames', '--diff-merges=first-parent',
+                input='\n'.join(chunk).encode() + b'\n',
+            )
+            return self._check_git(result, 'log')
+        
+        if len(chunks) <= 1:
+            return [log_chunk(chunk) for chunk in chunks]
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            return list(pool.map(log_chunk, chunks))
+    
+    @staticmethod
+    def _check_git(result: subprocess.CompletedProcess, command: str) -> str:
+        """Decoded stdout of a finished git command, or GitError."""
+        if result.returncode != 0:
+            raise GitError(f"git {command} failed: {result.stderr.decode('utf-8', 'replace').strip()}")
+        return result.stdout.decode('utf-8', 'replace')
+    
+    # Parse _LOG_FORMAT records followed by their numstat lines
+    _parse_git_log = staticmethod(parse_git_log)
+    
+    def _commit_cache_path(self, head_sha: str, limit: Optional[int]) -> Path:
+        """Location of the persisted history for a HEAD commit and limit."""
+        cache_dir = Path(self._repo.git_dir) / "git-dungeon" / "commits"
+        return cache_dir / f"v{COMMIT_CACHE_VERSION}-{head_sha}-{limit or 'all'}.json"
+    
+    def _load_commit_cache(self, head_sha: str, limit: Optional[int]) -> Optional[list[CommitInfo]]:
+        """Read a persisted history, or None on a cache miss."""
+        path = self._commit_cache_path(head_sha, limit)
+        try:
+            data = path.read_bytes()
+            rows = orjson.loads(data) if orjson else json.loads(data)
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        try:
+            for row in rows:  # a handful of authors repeat across every row
+                row[3] = sys.intern(row[3])
+                row[4] = sys.intern(row[4])
+            return [CommitInfo(*row) for row in rows]
+        except (TypeError, IndexError, KeyError):
+            # Valid JSON of the wrong shape; rebuild it like a missing file
+            return None
+    
+    def _store_commit_cache(
+        self, head_sha: str, limit: Optional[int], commit_infos: list[CommitInfo]
+    ) -> None:
+        """Persist a parsed history and evict the least recently used ones."""
+        rows = [
+            (
+                c.hexsha, c.short_sha, c.message, c.author_name, c.author_email,
+                c.committed_datetime, c.additions, c.deletions, c.files_changed,
+            )
+            for c in commit_infos
+        ]
+        path = self._commit_cache_path(head_sha, limit)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(
+                orjson.dumps(rows) if orjson else json.dumps(rows).encode("utf-8")
+            )
+            os.replace(tmp_path, path)
+            entries = sorted(
+                path.parent.glob("*.json"), key=lambda p: p.stat().st_mtime_ns, reverse=True
+            )
+            for stale in entries[COMMIT_CACHE_ENTRIES:]:
+                stale.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not write commit cache {path}: {e}")
+    
+    def _libgit2_stats(self, hexsha: str) -> tuple[int, int, int]:
+        """(additions, deletions, files_changed) from an in-process libgit2 diff.
+        
+        Like commit.stats: against the first parent, no rename detection,
+        root commits against the empty tree.
+        """
+        pgrepo = self._pgrepo
+        assert pgrepo is not None, "only called when pygit2 opened the repository"
+        commit = pgrepo[hexsha].peel(pygit2.Commit)
+        if commit.parents:
+            diff = pgrepo.diff(commit.parents[0], commit)
+        else:
+            diff = commit.tree.diff_to_tree(swap=True)
+        stats = diff.stats
+        return stats.insertions, stats.deletions, stats.files_changed
+    
     def parse_commit(self, commit) -> CommitInfo:
         """Parse a single Git commit."""
         try:
@@ -204,10 +480,13 @@ class OptimizedGitParser:
             
             # Get file changes
             try:
-                stats = commit.stats.total
-                additions = stats.get('insertions', 0)
-                deletions = stats.get('deletions', 0)
-                files_changed = len(commit.stats.files)
+                if self._pgrepo is not None:
+                    additions, deletions, files_changed = self._libgit2_stats(commit.hexsha)
+                else:
+                    stats = commit.stats.total
+                    additions = stats.get('insertions', 0)
+                    deletions = stats.get('deletions', 0)
+                    files_changed = len(commit.stats.files)
             except Exception:
                 additions = 0
                 deletions = 0
@@ -217,8 +496,8 @@ class OptimizedGitParser:
                 hexsha=commit.hexsha,
                 short_sha=commit.hexsha[:8],
                 message=message,
-                author_name=commit.author.name,
-                author_email=commit.author.email,
+                author_name=sys.intern(commit.author.name or ''),
+                author_email=sys.intern(commit.author.email or ''),
                 committed_datetime=str(commit.committed_datetime),
                 additions=additions,
                 deletions=deletions,
@@ -226,17 +505,7 @@ class OptimizedGitParser:
             )
         except Exception as e:
             logger.error(f"Failed to parse commit: {e}")
-            return CommitInfo(
-                hexsha="0" * 40,
-                short_sha="0" * 8,
-                message="Unknown",
-                author_name="Unknown",
-                author_email="unknown",
-                committed_datetime="",
-                additions=0,
-                deletions=0,
-                files_changed=0,
-            )
+            return _UNKNOWN_COMMIT
     
     def clear_cache(self) -> None:
         """Clear all caches."""
@@ -251,40 +520,51 @@ def get_git_log_fast(path: str, limit: int = 100) -> list[dict]:
     """
     Get git log using subprocess (faster than GitPython for bulk reads).
     
-    Format: hash|author|date|message
+    Returns dicts with hash, author, date and message (subject line).
+    """
+    try:
+        return list(iter_git_log_fast(path, limit))
+    except Exception as e:
+        logger.error(f"Failed to get git log: {e}")
+        return []
+
+
+def iter_git_log_fast(path: str, limit: int = 100) -> Iterator[dict]:
+    """
+    Yield git log entries while `git log` is still writing them.
+    
+    Fields are split on the ASCII unit separator, so '|' in author names
+    or subjects is kept intact. Closing the generator early stops git.
     """
     cmd = [
         'git', 'log',
-        '--pretty=format:%h|%an|%ad|%s',
+        '--pretty=format:%h%x1f%an%x1f%ad%x1f%s',
         '--date=iso',
         '-n', str(limit),
     ]
-    
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        errors='replace',
+        cwd=path,
+    )
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=path,
-            timeout=5,
-        )
-        
-        commits = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                parts = line.split('|', 3)
-                if len(parts) >= 4:
-                    commits.append({
-                        'hash': parts[0],
-                        'author': parts[1],
-                        'date': parts[2],
-                        'message': parts[3],
-                    })
-        
-        return commits
-    except Exception as e:
-        logger.error(f"Failed to get git log: {e}")
-        return []
+        for line in proc.stdout:
+            parts = line.rstrip('\n').split('\x1f', 3)
+            if len(parts) == 4:
+                yield {
+                    'hash': parts[0],
+                    'author': parts[1],
+                    'date': parts[2],
+                    'message': parts[3],
+                }
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
 
 
 def get_commit_diff_fast(path: str, commit_hash: str) -> tuple[int, int]:
@@ -294,9 +574,9 @@ def get_commit_diff_fast(path: str, commit_hash: str) -> tuple[int, int]:
     """
     cmd = [
         'git', 'show',
-        '--stat=200',  # Limit to 200 files
-        '--no-patch',
+        '--shortstat',  # implies no patch; --no-patch would hide it on git < 2.43
         '-1',
+        '--format=',
         commit_hash,
     ]
     
@@ -308,26 +588,49 @@ def get_commit_diff_fast(path: str, commit_hash: str) -> tuple[int, int]:
             cwd=path,
             timeout=5,
         )
-        
-        output = result.stdout
-        additions = 0
-        deletions = 0
-        
-        for line in output.split('\n'):
-            if 'insertion' in line:
-                try:
-                    additions = int(line.split()[0])
-                except Exception:
-                    pass
-            elif 'deletion' in line:
-                try:
-                    deletions = int(line.split()[0])
-                except Exception:
-                    pass
-        
-        return additions, deletions
     except Exception:
         return 0, 0
+    
+    additions = 0
+    deletions = 0
+    for match in _SHORTSTAT_RE.finditer(result.stdout):
+        if match.group(1):
+            additions = int(match.group(1))
+        else:
+            deletions = int(match.group(2))
+    return additions, deletions
+
+
+def get_commit_diffs_batch(path: str, shas: list[str]) -> dict[str, tuple[int, int, int]]:
+    """
+    Get (additions, deletions, files_changed) for many commits with one git log.
+    
+    Results are keyed by full hexsha. Merges are diffed against their first
+    parent, like the parser's history.
+    """
+    if not shas:
+        return {}
+    cmd = [
+        'git', 'log', '--no-walk=unsorted', '--stdin',
+        f'--format={_LOG_FORMAT}', '--numstat',
+        '--no-renames', '--diff-merges=first-parent',
+    ]
+    
+    try:
+        result = subprocess.run(
+            cmd,
+            input='\n'.join(shas) + '\n',
+            capture_output=True,
+            text=True,
+            errors='replace',
+            cwd=path,
+            check=True,
+        )
+    except Exception as e:
+        logger.error(f"Failed to get commit diffs: {e}")
+        return {}
+    
+    return {row[0]: row[5:] for row in OptimizedGitParser._parse_git_log(result.stdout)}
 
 
 if __name__ == "__main__":
@@ -340,24 +643,37 @@ if __name__ == "__main__":
     
     with tempfile.TemporaryDirectory() as tmpdir:
         repo_path = os.path.join(tmpdir, "test_repo")
-        os.makedirs(repo_path)
-        os.system(f"cd {repo_path} && git init > /dev/null 2>&1")
-        os.system(f"cd {repo_path} && git config user.email 'test@test.com'")
-        os.system(f"cd {repo_path} && git config user.name 'Test'")
-        
-        os.system(f"cd {repo_path} && echo 'init' > README.md && git add . && git commit -m 'Initial' -q")
+        subprocess.run(['git', 'init', '-q', '-b', 'main', repo_path], check=True)
         
-        # Create commits
-        for i in range(50):
-            os.system(f"cd {repo_path} && echo 'feat{i}' >> features.txt && git add . && git commit -m 'feat: feature {i}' -q 2>/dev/null")
+        # Create commits: one fast-import stream, no shell or worktree writes
+        stream = []
+        features = ''
+        for i in range(51):
+            if i == 0:
+                message, path, content = 'Initial', 'README.md', 'init\n'
+            else:
+                features += f'feat{i - 1}\n'
+                message, path, content = f'feat: feature {i - 1}', 'features.txt', features
+            stream += [
+                'commit refs/heads/main',
+                f'committer Test <test@test.com> {1700000000 + i} +0000',
+                f'data {len(message)}', message,
+                f'M 100644 inline {path}',
+                f'data {len(content)}', content,
+            ]
+        subprocess.run(
+            ['git', 'fast-import', '--quiet'],
+            input='\n'.join(stream) + '\n',
+            text=True,
+            cwd=repo_path,
+            check=True,
+        )
         
         print("\nRepository with 51 commits")
         
         # Test 1: OptimizedGitParser
         print("\nTest 1: OptimizedGitParser (10 loads)")
         
-        from git_dungeon.config import GameConfig
-        
         start = time.perf_counter()
         for _ in range(10):
             parser = OptimizedGitParser(GameConfig())
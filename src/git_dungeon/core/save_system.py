@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import mmap
 import os
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -17,25 +18,114 @@ from git_dungeon.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; slot listing decodes whole saves otherwise
+    ijson = None
+
 # Import GameState only for type checking (avoid circular import)
 if TYPE_CHECKING:
     from .game_engine import GameState
 
+# Full saves are gzip-compressed; files without the gzip magic are read as
+# the plain JSON written by older versions. Sidecars stay plain.
+SAVE_COMPRESSLEVEL = 6
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Number of slots listed by get_save_slots
+SAVE_SLOTS = 10
+
+# Saved character stats and the base value used when a save lacks one
+_STAT_DEFAULTS = {
+    "hp": 100,
+    "mp": 50,
+    "attack": 10,
+    "defense": 5,
+    "speed": 10,
+    "critical": 10,
+    "evasion": 5,
+    "luck": 5,
+}
+
+# Saved ItemStats keys: the declared fields, as dataclasses.asdict would give
+_ITEM_STATS_FIELDS = tuple(f.name for f in fields(ItemStats))
+
+
+# json.dumps builds a fresh JSONEncoder whenever options are passed, so the
+# fallback encoders are configured once and reused for every save.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+_JSON_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, default=str)
+
+
+def _encode_save(data: dict, pretty: bool = False) -> bytes:
+    """Encode save data as UTF-8 JSON, compact unless pretty is set."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, option=option, default=str)
+    encoder = _JSON_PRETTY_ENCODER if pretty else _JSON_ENCODER
+    return encoder.encode(data).encode("utf-8")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file in one call and swap it into place.
+
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def _read_save(path: Path) -> dict:
+    """Decode a save file, straight from a read-only mapping with orjson."""
+    if orjson is None:
+        raw = path.read_bytes()
+        if raw[:2] == _GZIP_MAGIC:
+            raw = gzip.decompress(raw)
+        return json.loads(raw)
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                if view[:2] == _GZIP_MAGIC:
+                    return orjson.loads(gzip.decompress(view))
+                return orjson.loads(view)
+
+
+def _read_save_metadata(path: Path) -> dict:
+    """Read only the metadata object of a save file.
+
+    With ijson the file is parsed just far enough to reach ``metadata``,
+    which the writer puts before the player, inventory and history.
+    """
+    if ijson is None:
+        return _read_save(path).get("metadata", {})
+    with open(path, "rb") as f:
+        stream = gzip.GzipFile(fileobj=f) if f.read(2) == _GZIP_MAGIC else f
+        f.seek(0)
+        for metadata in ijson.items(stream, "metadata", use_float=True):
+            return metadata
+    return {}
+
 
 def _config_to_dict(config: Any) -> dict:
     """Convert config to dict, handling enums and Pydantic models."""
     if hasattr(config, 'model_dump'):
-        result = {}
-        for key, value in config.model_dump().items():
-            if isinstance(value, Enum):
-                result[key] = value.value
-            else:
-                result[key] = value
-        return result
+        # JSON mode lets pydantic emit enum values itself instead of
+        # re-walking the dump in Python on every save.
+        return config.model_dump(mode="json")
     return {}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SaveMetadata:
     """Metadata for a save file."""
 
@@ -54,12 +144,16 @@ class SaveMetadata:
         return self.schema_version
 
     @classmethod
-    def create(cls) -> "SaveMetadata":
+    def create(cls, **values: Any) -> "SaveMetadata":
         """Create new metadata with current time."""
-        return cls(save_time=datetime.now().isoformat())
+        return cls(save_time=datetime.now().isoformat(), **values)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Get field values as a dict (all scalars, so no deep copy)."""
+        return {name: getattr(self, name) for name in self.__slots__}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GameSaveData:
     """Complete game save data."""
 
@@ -105,6 +199,17 @@ class SaveSystem:
         """
         return self.save_dir / f"save_{slot}.json"
 
+    def get_metadata_path(self, slot: int = 0) -> Path:
+        """Get path for a save slot's metadata sidecar.
+
+        Args:
+            slot: Save slot number (0-9)
+
+        Returns:
+            Path to the small file holding only the slot's metadata
+        """
+        return self.save_dir / f"save_{slot}.meta.json"
+
     def save(
         self,
         game_state: "GameState",
@@ -122,8 +227,16 @@ class SaveSystem:
         try:
             save_data = self._collect_save_data(game_state)
             save_path = self.get_save_path(slot)
-            with open(save_path, "w", encoding="utf-8") as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False, default=str)
+            meta_path = self.get_metadata_path(slot)
+            # Drop the old sidecar first so it can never describe a newer save
+            meta_path.unlink(missing_ok=True)
+            # GIT_DUNGEON_PRETTY_SAVES=1 writes plain indented JSON for debugging
+            if os.getenv("GIT_DUNGEON_PRETTY_SAVES") == "1":
+                payload = _encode_save(save_data, pretty=True)
+            else:
+                payload = gzip.compress(_encode_save(save_data), SAVE_COMPRESSLEVEL, mtime=0)
+            _write_atomic(save_path, payload)
+            _write_atomic(meta_path, _encode_save(save_data["metadata"]))
 
             logger.info(f"Saved game to slot {slot}")
             return True
@@ -149,13 +262,12 @@ class SaveSystem:
         try:
             save_path = self.get_save_path(slot)
 
-            if not save_path.exists():
+            try:
+                save_data = _read_save(save_path)
+            except FileNotFoundError:
                 logger.warning(f"Save file not found: {save_path}")
                 return False
 
-            with open(save_path, "r", encoding="utf-8") as f:
-                save_data = json.load(f)
-
             self._restore_save_data(game_state, save_data)
 
             logger.info(f"Loaded game from slot {slot}")
@@ -182,8 +294,7 @@ class SaveSystem:
             if isinstance(save_path, str):
                 save_path = Path(save_path)
 
-            with open(save_path, "r", encoding="utf-8") as f:
-                save_data = json.load(f)
+            save_data = _read_save(save_path)
 
             settings_data = save_data.get("settings", {})
             config = GameConfig(**settings_data) if settings_data else GameConfig()
@@ -210,17 +321,20 @@ class SaveSystem:
         player_char = player_entity.get_component(CharacterComponent)
         inventory_comp = player_entity.get_component(InventoryComponent)
 
-        metadata = SaveMetadata.create()
         if player_char:
-            metadata.player_level = player_char.level
-            metadata.player_hp = player_char.current_hp
-            metadata.player_max_hp = player_char.stats.hp.value if player_char.stats else 0
-            metadata.current_commit_index = game_state.current_commit_index
-            metadata.total_commits_defeated = len(game_state.defeated_commits)
+            metadata = SaveMetadata.create(
+                player_level=player_char.level,
+                player_hp=player_char.current_hp,
+                player_max_hp=player_char.stats.hp.value if player_char.stats else 0,
+                current_commit_index=game_state.current_commit_index,
+                total_commits_defeated=len(game_state.defeated_commits),
+            )
+        else:
+            metadata = SaveMetadata.create()
 
         return {
             "version": "1.0.0",
-            "metadata": asdict(metadata),
+            "metadata": metadata.to_dict(),
             "player": self._serialize_entity(player_entity) if player_entity else {},
             "inventory": self._serialize_inventory(inventory_comp),  # type: ignore[arg-type]
             "defeated_commits": game_state.defeated_commits,
@@ -255,6 +369,7 @@ class SaveSystem:
         if not char:
             return {}
 
+        stats = char.stats  # type: ignore[attr-defined,union-attr]
         return {
             "name": entity.name,
             "level": char.level,  # type: ignore[attr-defined,union-attr]
@@ -263,15 +378,8 @@ class SaveSystem:
             "hp": char.current_hp,  # type: ignore[attr-defined,union-attr]
             "mp": char.current_mp,  # type: ignore[attr-defined,union-attr]
             "stats": {
-                "hp": char.stats.hp.value if char.stats else 0,  # type: ignore[attr-defined,union-attr]
-                "mp": char.stats.mp.value if char.stats else 0,  # type: ignore[attr-defined,union-attr]
-                "attack": char.stats.attack.value if char.stats else 0,  # type: ignore[attr-defined,union-attr]
-                "defense": char.stats.defense.value if char.stats else 0,  # type: ignore[attr-defined,union-attr]
-                "speed": char.stats.speed.value if char.stats else 0,  # type: ignore[attr-defined,union-attr]
-                "critical": char.stats.critical.value if char.stats else 0,  # type: ignore[attr-defined,union-attr]
-                "evasion": char.stats.evasion.value if char.stats else 0,  # type: ignore[attr-defined,union-attr]
-                "luck": char.stats.luck.value if char.stats else 0,  # type: ignore[attr-defined,union-attr]
-            } if char.stats else {},  # type: ignore[attr-defined]
+                name: getattr(stats, name).value for name in _STAT_DEFAULTS
+            } if stats else {},
         }
 
     def _deserialize_entity(self, entity: Entity, data: dict) -> None:
@@ -287,15 +395,10 @@ class SaveSystem:
         char.current_mp = data.get("mp", 50)  # type: ignore[attr-defined,union-attr]
 
         stats_data = data.get("stats", {})
-        if stats_data and char.stats:  # type: ignore[attr-defined,union-attr]
-            char.stats.hp.base_value = stats_data.get("hp", 100)  # type: ignore[attr-defined,union-attr]
-            char.stats.mp.base_value = stats_data.get("mp", 50)  # type: ignore[attr-defined,union-attr]
-            char.stats.attack.base_value = stats_data.get("attack", 10)  # type: ignore[attr-defined,union-attr]
-            char.stats.defense.base_value = stats_data.get("defense", 5)  # type: ignore[attr-defined,union-attr]
-            char.stats.speed.base_value = stats_data.get("speed", 10)  # type: ignore[attr-defined,union-attr]
-            char.stats.critical.base_value = stats_data.get("critical", 10)  # type: ignore[attr-defined,union-attr]
-            char.stats.evasion.base_value = stats_data.get("evasion", 5)  # type: ignore[attr-defined,union-attr]
-            char.stats.luck.base_value = stats_data.get("luck", 5)  # type: ignore[attr-defined,union-attr]
+        stats = char.stats  # type: ignore[attr-defined,union-attr]
+        if stats_data and stats:
+            for name, default in _STAT_DEFAULTS.items():
+                getattr(stats, name).base_value = stats_data.get(name, default)
 
     def _serialize_inventory(self, inventory: Optional[InventoryComponent]) -> dict:
         """Serialize inventory."""
@@ -315,7 +418,7 @@ class SaveSystem:
                     "value": item.value,
                     "stackable": item.stackable,
                     "stack_count": item.stack_count,
-                    "stats": asdict(item.stats),
+                    "stats": {name: getattr(item.stats, name) for name in _ITEM_STATS_FIELDS},
                 })
 
         return {
@@ -358,28 +461,29 @@ class SaveSystem:
 
     def get_save_slots(self) -> list[dict]:
         """Get info about all save slots."""
-        slots = []
-        for i in range(10):
-            path = self.get_save_path(i)
-            if path.exists():
-                try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    metadata = data.get("metadata", {})
-                    slots.append({
-                        "slot": i,
-                        "exists": True,
-                        "save_time": metadata.get("save_time", ""),
-                        "player_level": metadata.get("player_level", 0),
-                        "commits_defeated": metadata.get("total_commits_defeated", 0),
-                    })
-                except Exception:
-                    slots.append({"slot": i, "exists": True, "error": True})
-            else:
-                slots.append({"slot": i, "exists": False})
+        return [self._read_slot_meta(slot) for slot in range(SAVE_SLOTS)]
 
-        return slots
+    def _read_slot_meta(self, slot: int) -> dict:
+        """Summarize one save slot for the slot list."""
+        # Open directly rather than stat first: a missing file costs the
+        # same failed lookup either way. The sidecar never outlives its save
+        # (save and delete_save remove it first), so finding it is enough.
+        try:
+            try:
+                metadata = _read_save(self.get_metadata_path(slot))
+            except FileNotFoundError:  # saved before sidecars were written
+                metadata = _read_save_metadata(self.get_save_path(slot))
+            return {
+                "slot": slot,
+                "exists": True,
+                "save_time": metadata.get("save_time", ""),
+                "player_level": metadata.get("player_level", 0),
+                "commits_defeated": metadata.get("total_commits_defeated", 0),
+            }
+        except FileNotFoundError:
+            return {"slot": slot, "exists": False}
+        except Exception:
+            return {"slot": slot, "exists": True, "error": True}
 
     def delete_save(self, slot: int) -> bool:
         """Delete a save slot.
@@ -391,9 +495,8 @@ class SaveSystem:
             True if successful
         """
         try:
-            path = self.get_save_path(slot)
-            if path.exists():
-                path.unlink()
+            self.get_metadata_path(slot).unlink(missing_ok=True)
+            self.get_save_path(slot).unlink(missing_ok=True)
             return True
         except Exception as e:
             logger.error(f"Failed to delete save: {e}")
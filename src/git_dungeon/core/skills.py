@@ -26,7 +26,7 @@ class TargetType(Enum):
     ALL = "all"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkillEffect:
     """Effect applied by a skill."""
 
@@ -36,7 +36,7 @@ class SkillEffect:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Skill:
     """A skill that can be used in combat.
 
@@ -162,6 +162,13 @@ SKILLS = {
 }
 
 
+# SKILLS grouped by type, built once at import
+_SKILLS_BY_TYPE: dict[SkillType, tuple[Skill, ...]] = {
+    skill_type: tuple(s for s in SKILLS.values() if s.skill_type == skill_type)
+    for skill_type in SkillType
+}
+
+
 def get_skill(skill_id: str) -> Optional[Skill]:
     """Get a skill by ID.
 
@@ -192,15 +199,21 @@ def get_skills_by_type(skill_type: SkillType) -> list[Skill]:
     Returns:
         List of skills of the given type
     """
-    return [s for s in SKILLS.values() if s.skill_type == skill_type]
+    return list(_SKILLS_BY_TYPE[skill_type])
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillBook:
     """Collection of skills available to a character."""
 
     skills: dict[str, int] = field(default_factory=dict)  # skill_id -> mastery_level
 
+    def __post_init__(self) -> None:
+        # Only known skills are ever stored, so lookups need no re-check
+        self.skills = {
+            skill_id: level for skill_id, level in self.skills.items() if skill_id in SKILLS
+        }
+
     def add_skill(self, skill_id: str, level: int = 1) -> bool:
         """Add a skill to the book.
 
@@ -226,8 +239,4 @@ class SkillBook:
 
     def get_available_skills(self) -> list[tuple[Skill, int]]:
         """Get all skills with their mastery levels."""
-        return [
-            (SKILLS[skill_id], level)
-            for skill_id, level in self.skills.items()
-            if skill_id in SKILLS
-        ]
+        return [(SKILLS[skill_id], level) for skill_id, level in self.skills.items()]
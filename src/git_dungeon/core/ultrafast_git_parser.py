@@ -5,28 +5,49 @@ Ultra-Fast Git Parser
 """
 
 import os
+import re
 import subprocess
 import tempfile
-from typing import Optional
-from pathlib import Path
+from collections import OrderedDict
+from typing import Iterator, Optional
 
-from git import Repo, InvalidGitRepositoryError
+from git import Repo, InvalidGitRepositoryError, NoSuchPathError
 
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from config import GameConfig
+from git_dungeon.config import GameConfig
+from git_dungeon.core.optimized_git_parser import CommitColumns
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Conventional-commit prefixes (matched with startswith semantics, in this
+# order) -> creature
+_CREATURE_NAMES = {
+    "feat": "Feature",
+    "fix": "Bug",
+    "docs": "Documentation",
+    "refactor": "Refactor",
+    "test": "Test",
+    "chore": "Chore",
+    "style": "Style",
+    "perf": "Performance",
+    "merge": "Merge",
+    "revert": "Revert",
+    "ci": "CI",
+    "build": "Build",
+    "opt": "Optimization",
+    "hotfix": "Hotfix",
+}
+_CREATURE_PREFIX = re.compile("|".join(_CREATURE_NAMES))
+_CREATURE_PREFIX_LEN = max(map(len, _CREATURE_NAMES))
+
 
 class CommitInfo:
     """Lightweight commit info (no file_changes for speed)."""
     
     __slots__ = (
         'hexsha', 'short_sha', 'message', 'author_name', 'author_email',
-        'committed_datetime', 'additions', 'deletions', 'files_changed'
+        'committed_datetime', 'additions', 'deletions', 'files_changed',
+        '_creature',
     )
     
     def __init__(
@@ -50,75 +71,98 @@ class CommitInfo:
         self.additions = additions
         self.deletions = deletions
         self.files_changed = files_changed
+        self._creature: Optional[str] = None  # memoized by get_creature_name
     
     def get_creature_name(self) -> str:
         """Get monster name based on commit message."""
-        msg = self.message.lower()
-        
-        prefixes = [
-            ("feat", "Feature"), ("fix", "Bug"), ("docs", "Documentation"),
-            ("refactor", "Refactor"), ("test", "Test"), ("chore", "Chore"),
-            ("style", "Style"), ("perf", "Performance"), ("merge", "Merge"),
-            ("revert", "Revert"), ("ci", "CI"), ("build", "Build"),
-            ("opt", "Optimization"), ("hotfix", "Hotfix"),
-        ]
-        
-        for prefix, name in prefixes:
-            if msg.startswith(prefix):
-                return name
-        
-        if "(" in msg:
-            return msg.split("(")[0].capitalize()
-        
-        return self.message.split()[0].capitalize() if self.message.split() else "Unknown"
+        if self._creature is None:
+            self._creature = _creature_name(self.message)
+        return self._creature
+
+
+def _creature_name(message: str) -> str:
+    """Monster name for a commit message."""
+    # Only the head of the message can hold a known prefix
+    match = _CREATURE_PREFIX.match(message[:_CREATURE_PREFIX_LEN].lower())
+    if match:
+        return _CREATURE_NAMES[match.group()]
+    
+    msg = message.lower()
+    if "(" in msg:
+        return msg.split("(")[0].capitalize()
+    
+    words = message.split()
+    return words[0].capitalize() if words else "Unknown"
+
+
+# LRU cache of opened repos keyed by git dir (most recently used last),
+# shared by both parsers so a repository is only opened once
+_REPOS: OrderedDict[str, Repo] = OrderedDict()
+_MAX_REPOS = 10
+# Absolute caller path -> git dir it resolved to, so equivalent
+# paths (relative, subdirectories, symlinks) share one cache entry
+_REPO_ALIASES: dict[str, str] = {}
+
+
+def _open_repo(path: str) -> Repo:
+    """Get cached Repo object, reopening it if its HEAD became invalid."""
+    # Absolute so a relative path means the same thing from any cwd
+    path = os.path.abspath(path)
+    
+    alias_dir = _REPO_ALIASES.get(path)
+    if alias_dir is not None and alias_dir in _REPOS:
+        try:
+            if _REPOS[alias_dir].head.is_valid():
+                _REPOS.move_to_end(alias_dir)
+                return _REPOS[alias_dir]
+        except Exception:
+            _REPOS.pop(alias_dir).close()
+    
+    repo = Repo(path, search_parent_directories=True)
+    git_dir: str = repo.git_dir
+    cached = _REPOS.get(git_dir)
+    if cached is not None:
+        # Already open under another path; keep the single shared instance
+        repo.close()
+        repo = cached
+    _REPOS[git_dir] = repo
+    _REPOS.move_to_end(git_dir)
+    _REPO_ALIASES[path] = git_dir
+    while len(_REPOS) > _MAX_REPOS:
+        # Drop the least recently used repo and release its git processes
+        evicted_dir, evicted = _REPOS.popitem(last=False)
+        evicted.close()
+        for alias in [a for a, d in _REPO_ALIASES.items() if d == evicted_dir]:
+            del _REPO_ALIASES[alias]
+    return repo
 
 
 class UltraFastGitParser:
     """Git parser optimized for speed using subprocess."""
     
-    # Cache for repo paths
-    _repo_cache: dict[str, Repo] = {}
-    # Cache for commit stats (hash -> (additions, deletions, files))
-    _stats_cache: dict[str, tuple[int, int, int]] = {}
+    _repo_cache = _REPOS  # shared with FastGitParser
+    # LRU cache for commit stats (hash -> (additions, deletions, files))
+    _stats_cache: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+    _max_stats_cache_size: int = 4096
     
     def __init__(self, config: Optional[GameConfig] = None):
         self.config = config or GameConfig()
         self._repo: Optional[Repo] = None
     
-    @classmethod
-    def _get_repo(cls, path: str) -> Repo:
-        """Get cached Repo object."""
-        path = str(path)
-        
-        if path in cls._repo_cache:
-            try:
-                if cls._repo_cache[path].head.is_valid():
-                    return cls._repo_cache[path]
-            except Exception:
-                pass
-        
-        repo = Repo(path, search_parent_directories=True)
-        if len(cls._repo_cache) >= 10:
-            cls._repo_cache.pop(next(iter(cls._repo_cache)))
-        cls._repo_cache[path] = repo
-        return repo
+    _get_repo = staticmethod(_open_repo)
     
     def load_repository(self, path: str) -> None:
         """Load a Git repository."""
+        # Repo() already checks the path, so no stat calls beforehand;
+        # a cache hit touches the filesystem only to validate HEAD
         try:
-            repo_path = Path(path).resolve()
-            
-            if not repo_path.exists():
-                raise ValueError(f"Repository path does not exist: {path}")
-            
-            if not (repo_path / ".git").exists():
-                raise ValueError(f"Not a Git repository: {path}")
-            
-            self._repo = self._get_repo(str(repo_path))
-            logger.info(f"Loaded repository at {path}")
-            
+            self._repo = self._get_repo(path)
+        except NoSuchPathError:
+            raise ValueError(f"Repository path does not exist: {path}")
         except InvalidGitRepositoryError as e:
             raise ValueError(f"Invalid Git repository: {e}")
+        
+        logger.info(f"Loaded repository at {path}")
     
     def get_commit_history(
         self,
@@ -129,56 +173,8 @@ class UltraFastGitParser:
         if self._repo is None:
             raise ValueError("Repository not loaded")
         
-        # Use subprocess for fast commit enumeration
-        # Format: hash|author|date|message|additions|deletions|files
-        cmd = [
-            'git', 'log',
-            '--pretty=format:%h|%an|%ad|%s|%H',
-            '--date=iso',
-            '-n', str(limit or 1000),
-        ]
-        
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self._repo.working_tree_dir,
-                timeout=10,
-            )
-            
-            commits = []
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                
-                parts = line.split('|', 5)
-                if len(parts) >= 5:
-                    short_sha = parts[0]
-                    author = parts[1]
-                    date = parts[2]
-                    message = parts[3]
-                    full_hash = parts[4] if len(parts) > 4 else short_sha
-                    
-                    # Get stats from cache or subprocess
-                    if full_hash in self._stats_cache:
-                        additions, deletions, files = self._stats_cache[full_hash]
-                    else:
-                        additions, deletions, files = self._get_commit_stats(full_hash)
-                        self._stats_cache[full_hash] = (additions, deletions, files)
-                    
-                    commit = CommitInfo(
-                        hexsha=full_hash,
-                        short_sha=short_sha,
-                        message=message,
-                        author_name=author,
-                        author_email="",  # Not in this format
-                        committed_datetime=date,
-                        additions=additions,
-                        deletions=deletions,
-                        files_changed=files,
-                    )
-                    commits.append(commit)
+            commits = list(self.iter_commit_history(limit))
             
             if reverse:
                 commits = commits[::-1]
@@ -189,76 +185,159 @@ class UltraFastGitParser:
             logger.error(f"Failed to get commit history: {e}")
             return []
     
-    def _get_commit_stats(self, commit_hash: str) -> tuple[int, int, int]:
-        """Get commit stats using subprocess (fast)."""
+    def iter_commit_history(self, limit: Optional[int] = None) -> Iterator[CommitInfo]:
+        """Yield commits newest first while `git log` is still writing them.
+        
+        Without a limit the whole history is read; stop iterating to stop
+        git, so callers that only need the first few commits pay for those.
+        """
+        if self._repo is None:
+            raise ValueError("Repository not loaded")
+        
+        for header, numstat in self._iter_log_records(self._log_command(limit)):
+            full_hash, author, date, message = header.split('\x1f', 3)
+            additions, deletions, files = self._commit_stats(full_hash, numstat)
+            
+            yield CommitInfo(
+                hexsha=full_hash,
+                short_sha=full_hash[:8],
+                message=message,
+                author_name=author,
+                author_email="",  # Not in this format
+                committed_datetime=date,
+                additions=additions,
+                deletions=deletions,
+                files_changed=files,
+            )
+    
+    def get_commit_history_soa(self, limit: Optional[int] = None) -> CommitColumns:
+        """Get commit history as parallel columns (newest first).
+        
+        Columns are filled straight from the `git log` stream, so no
+        CommitInfo object is built per commit.
+        """
+        if self._repo is None:
+            raise ValueError("Repository not loaded")
+        
+        columns = CommitColumns()
+        author_index: dict[str, int] = {}
+        try:
+            for header, numstat in self._iter_log_records(self._log_command(limit)):
+                full_hash, author, _ = header.split('\x1f', 2)
+                additions, deletions, files = self._commit_stats(full_hash, numstat)
+                
+                idx = author_index.get(author)
+                if idx is None:
+                    idx = author_index[author] = len(columns.authors)
+                    columns.authors.append(author)
+                columns.hexsha.append(full_hash)
+                columns.additions.append(additions)
+                columns.deletions.append(deletions)
+                columns.files_changed.append(files)
+                columns.author_idx.append(idx)
+            
+            return columns
+            
+        except Exception as e:
+            logger.error(f"Failed to get commit history: {e}")
+            return CommitColumns()
+    
+    @staticmethod
+    def _log_command(limit: Optional[int]) -> list[str]:
+        """`git log` listing commits with their numstat lines.
+        
+        Each record starts with \\x01 and its header fields are
+        \\x1f-separated.
+        """
         cmd = [
-            'git', 'show',
+            'git', 'log',
             '--numstat',
-            '--pretty=format:',
-            '-1',
-            commit_hash,
+            '--pretty=format:%x01%H%x1f%an%x1f%ad%x1f%s',
+            '--date=iso',
         ]
+        if limit is not None:
+            cmd += ['-n', str(limit)]
+        return cmd
+    
+    def _commit_stats(self, full_hash: str, numstat: list[bytes]) -> tuple[int, int, int]:
+        """Line stats for one commit, through the LRU stats cache."""
+        stats = self._stats_cache.get(full_hash)
+        if stats is None:
+            stats = self._stats_cache[full_hash] = self._sum_numstat(numstat)
+            if len(self._stats_cache) > self._max_stats_cache_size:
+                self._stats_cache.popitem(last=False)
+        else:
+            self._stats_cache.move_to_end(full_hash)
+        return stats
+    
+    def _iter_log_records(self, cmd: list[str]) -> Iterator[tuple[str, list[bytes]]]:
+        """Yield (header, numstat lines) per commit while `git log` is still writing.
         
+        Only the header is decoded; numstat lines stay bytes, which int()
+        parses directly. Closing the generator early stops git.
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self._repo.working_tree_dir,
+            bufsize=1024 * 1024,
+        )
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=self._repo.working_tree_dir,
-                timeout=5,
-            )
-            
-            additions = 0
-            deletions = 0
-            files = 0
-            
-            for line in result.stdout.split('\n'):
-                if not line or line.startswith('-'):
-                    continue
-                
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        if parts[0] != '-':
-                            additions += int(parts[0])
-                        if parts[1] != '-':
-                            deletions += int(parts[1])
-                        files += 1
-                    except (ValueError, IndexError):
-                        pass
-            
-            return additions, deletions, files
+            header = None
+            numstat: list[bytes] = []
+            for line in proc.stdout:
+                if line.startswith(b'\x01'):
+                    if header is not None:
+                        yield header, numstat
+                    header = line[1:].rstrip(b'\n').decode('utf-8', 'replace')
+                    numstat = []
+                elif header is not None:
+                    numstat.append(line)
+            if header is not None:
+                yield header, numstat
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+    
+    @staticmethod
+    def _sum_numstat(lines: list[bytes]) -> tuple[int, int, int]:
+        """Total the `added<TAB>deleted<TAB>path` lines of one commit."""
+        additions = 0
+        deletions = 0
+        files = 0
+        
+        for line in lines:
+            added, tab, rest = line.partition(b'\t')
+            if not tab:  # blank line between records
+                continue
             
-        except Exception:
-            return 0, 0, 0
+            files += 1
+            if added != b'-':  # binary files have no line counts
+                additions += int(added)
+                deletions += int(rest.partition(b'\t')[0])
+        
+        return additions, deletions, files
     
     def clear_cache(self) -> None:
         """Clear all caches."""
         self._repo_cache.clear()
+        _REPO_ALIASES.clear()
         self._stats_cache.clear()
 
 
 class FastGitParser:
     """Hybrid parser: use GitPython for commits, subprocess for stats."""
     
-    _repo_cache: dict[str, Repo] = {}
+    _repo_cache = _REPOS  # shared with UltraFastGitParser
     
     def __init__(self, config: Optional[GameConfig] = None):
         self.config = config or GameConfig()
         self._repo: Optional[Repo] = None
     
-    @classmethod
-    def _get_repo(cls, path: str) -> Repo:
-        path = str(path)
-        if path in cls._repo_cache:
-            try:
-                if cls._repo_cache[path].head.is_valid():
-                    return cls._repo_cache[path]
-            except Exception:
-                pass
-        repo = Repo(path, search_parent_directories=True)
-        cls._repo_cache[path] = repo
-        return repo
+    _get_repo = staticmethod(_open_repo)
     
     def load_repository(self, path: str) -> None:
         self._repo = self._get_repo(path)
@@ -267,14 +346,9 @@ class FastGitParser:
         if self._repo is None:
             raise ValueError("Not loaded")
         
-        # Use GitPython for commit enumeration (cached)
-        try:
-            commits = list(self._repo.head.commit.iter_items(
-                self._repo,
-                self._repo.head.reference
-            ))[:limit]
-        except Exception:
-            commits = list(self._repo.iter_commits())[:limit]
+        # Use GitPython for commit enumeration; max_count stops git's walk
+        # instead of trimming a full history afterwards
+        commits = self._repo.iter_commits(max_count=limit)
         
         # Parse commits (no file changes for speed)
         result = []
@@ -1,5 +1,7 @@
 # __init__.py - Engine package (M1: Rewards & Archetype)
 
+import importlib
+
 from .events import (
     EventType,
     GameEvent,
@@ -50,27 +52,44 @@ from .model import (
 
 from .engine import Engine
 
-# M1: Rewards & Archetype
-from .rules.rewards import (
-    RewardType,
-    RewardOption,
-    RewardBundle,
-    ArchetypeBias,
-    RewardsEngine,
-    ArchetypeEngine,
-    create_rewards_engine,
-    create_archetype_engine,
-)
+# M1: Rewards & Archetype - imported on first access (PEP 562), so callers
+# that only need the engine core do not load these rule modules
+_LAZY_EXPORTS = {
+    **dict.fromkeys(
+        (
+            "RewardType",
+            "RewardOption",
+            "RewardBundle",
+            "ArchetypeBias",
+            "RewardsEngine",
+            "ArchetypeEngine",
+            "create_rewards_engine",
+            "create_archetype_engine",
+        ),
+        ".rules.rewards",
+    ),
+    **dict.fromkeys(
+        (
+            "Archetype",
+            "ArchetypeDefinition",
+            "ARCHETYPE_CONFIGS",
+            "ArchetypeManager",
+            "BiasTracker",
+            "create_archetype_manager",
+            "create_bias_tracker",
+        ),
+        ".rules.archetype",
+    ),
+}
 
-from .rules.archetype import (
-    Archetype,
-    ArchetypeDefinition,
-    ARCHETYPE_CONFIGS,
-    ArchetypeManager,
-    BiasTracker,
-    create_archetype_manager,
-    create_bias_tracker,
-)
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
 
 __all__ = [
     # Events
@@ -290,6 +290,8 @@ class AchievementManager:
         self._progress: Dict[str, AchievementProgress] = {}
         self._unlocked: Set[str] = set(profile_achievements or [])
         self._session_stats: Dict[str, int] = {}
+        # 按条件类型索引成就，check_and_unlock 只检查相关成就
+        self._by_condition: dict[str, list[tuple[str, AchievementDef]]] = {}
         
         # 初始化所有成就的进度跟踪
         for ach_id, ach_def in ACHIEVEMENT_DEFINITIONS.items():
@@ -298,6 +300,7 @@ class AchievementManager:
                 if ach_id in self._unlocked:
                     progress.unlocked_at = "unknown"  # 旧成就
                 self._progress[ach_id] = progress
+            self._by_condition.setdefault(ach_def.condition_type, []).append((ach_id, ach_def))
     
     def get_unlocked(self) -> List[str]:
         """获取已解锁成就列表"""
@@ -326,15 +329,14 @@ class AchievementManager:
         """
         newly_unlocked: List[str] = []
         
-        for ach_id, ach_def in ACHIEVEMENT_DEFINITIONS.items():
+        for ach_id, ach_def in self._by_condition.get(condition_type, ()):
             if ach_id in self._unlocked:
                 continue
             
-            if ach_def.condition_type == condition_type:
-                # 使用累计值检查
-                if ach_def.check_condition(value):
-                    self._unlock_achievement(ach_id)
-                    newly_unlocked.append(ach_id)
+            # 使用累计值检查
+            if ach_def.check_condition(value):
+                self._unlock_achievement(ach_id)
+                newly_unlocked.append(ach_id)
         
         return newly_unlocked
     
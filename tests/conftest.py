@@ -62,3 +62,30 @@ def pytest_collection_modifyitems(config, items):
 
         if "golden" in parts or item_path.name in {"golden_test.py", "test_golden.py"}:
             item.add_marker(pytest.mark.golden)
+
+
+@pytest.fixture
+def sample_repo(tmp_path):
+    """A throwaway git repository with a few conventional commits.
+
+    Run the game against this instead of the project checkout, so the
+    per-repository history cache is written under tmp_path.
+    """
+    import subprocess
+
+    repo_path = tmp_path / "sample_repo"
+    repo_path.mkdir()
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=repo_path, check=True, capture_output=True, text=True)
+
+    git("init")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test User")
+    messages = ("feat: add map", "fix: crash on load", "docs: readme", "refactor: split combat",
+                "test: cover shops", "perf: faster log", "chore: bump deps", "feat: add boss")
+    for i, message in enumerate(messages * 3):
+        (repo_path / f"file_{i % 5}.txt").write_text(f"{i}\n" * (i + 1), encoding="utf-8")
+        git("add", ".")
+        git("commit", "-m", message)
+    return repo_path
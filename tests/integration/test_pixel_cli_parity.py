@@ -21,7 +21,7 @@ PARITY_FIELDS = (
 )
 
 
-def test_pixel_headless_auto_metrics_match_cli(tmp_path: Path) -> None:
+def test_pixel_headless_auto_metrics_match_cli(tmp_path: Path, sample_repo: Path) -> None:
     root = Path(__file__).resolve().parents[2]
     cli_json = tmp_path / "cli.json"
     pixel_json = tmp_path / "pixel.json"
@@ -32,7 +32,7 @@ def test_pixel_headless_auto_metrics_match_cli(tmp_path: Path) -> None:
             sys.executable,
             "-m",
             "git_dungeon",
-            ".",
+            str(sample_repo),
             "--seed",
             "42",
             "--auto",
@@ -49,7 +49,7 @@ def test_pixel_headless_auto_metrics_match_cli(tmp_path: Path) -> None:
             sys.executable,
             "-m",
             "git_dungeon",
-            ".",
+            str(sample_repo),
             "--pixel",
             "--auto",
             "--headless",
@@ -8,7 +8,7 @@ import sys
 from pathlib import Path
 
 
-def test_pixel_ui_smoke_creates_settings(tmp_path: Path) -> None:
+def test_pixel_ui_smoke_creates_settings(tmp_path: Path, sample_repo: Path) -> None:
     save_dir = tmp_path / "save"
     env = {
         **os.environ,
@@ -23,7 +23,7 @@ def test_pixel_ui_smoke_creates_settings(tmp_path: Path) -> None:
             sys.executable,
             "-m",
             "git_dungeon",
-            ".",
+            str(sample_repo),
             "--pixel",
             "--seed",
             "42",
@@ -44,7 +44,7 @@ def test_pixel_ui_smoke_creates_settings(tmp_path: Path) -> None:
     assert 'lang = "zh_CN"' in settings.read_text(encoding="utf-8")
 
 
-def test_pixel_missing_assets_show_startup_error(tmp_path: Path) -> None:
+def test_pixel_missing_assets_show_startup_error(tmp_path: Path, sample_repo: Path) -> None:
     env = {
         **os.environ,
         "PYTHONPATH": "src",
@@ -59,7 +59,7 @@ def test_pixel_missing_assets_show_startup_error(tmp_path: Path) -> None:
             sys.executable,
             "-m",
             "git_dungeon",
-            ".",
+            str(sample_repo),
             "--pixel",
             "--seed",
             "42",
@@ -1,5 +1,6 @@
 """Unit tests for git_parser module."""
 
+import json
 import subprocess
 import pytest
 from unittest.mock import patch, MagicMock
@@ -12,7 +13,7 @@ class TestCommitInfo:
 
     def test_total_changes(self):
         """Test total_changes calculation."""
-        commit = CommitInfo(
+        commit = CommitInfo.from_legacy(
             hash="abc123",
             short_hash="abc12345",
             message="Test commit",
@@ -30,7 +31,7 @@ class TestCommitInfo:
     def test_difficulty_factor(self):
         """Test difficulty_factor calculation."""
         # Normal commit
-        normal = CommitInfo(
+        normal = CommitInfo.from_legacy(
             hash="abc",
             short_hash="abc",
             message="Fix bug",
@@ -45,7 +46,7 @@ class TestCommitInfo:
         assert normal.difficulty_factor == 1.0
 
         # Large commit with merge
-        large = CommitInfo(
+        large = CommitInfo.from_legacy(
             hash="def",
             short_hash="def",
             message="Merge branch",
@@ -59,9 +60,43 @@ class TestCommitInfo:
         )
         assert large.difficulty_factor == 2.0  # 1.0 + 0.5 (additions) + 0.3 (deletions) + 0.2 (merge)
 
+        # Merge/revert detected from the message alone
+        revert = CommitInfo.from_legacy(
+            hash="ghi",
+            short_hash="ghi",
+            message="Revert \"Merge branch 'x'\"",
+            author="Test",
+            author_email="test@example.com",
+            datetime=None,  # type: ignore
+            additions=0,
+            deletions=0,
+            files_changed=7,
+        )
+        assert revert.difficulty_factor == 1.8  # 1.0 + 0.1 (files) + 0.2 (merge) + 0.5 (revert)
+
+    def test_positional_and_legacy_constructors_agree(self):
+        """The lean constructor and from_legacy should build the same commit."""
+        lean = CommitInfo("a" * 40, "aaaaaaaa", "fix: bug", "Dev", "dev@example.com", "2024-01-01", 3, 1, 2)
+        legacy = CommitInfo.from_legacy(
+            hash="a" * 40,
+            short_hash="aaaaaaaa",
+            message="fix: bug",
+            author="Dev",
+            author_email="dev@example.com",
+            datetime="2024-01-01",
+            additions=3,
+            deletions=1,
+            files_changed=2,
+        )
+
+        for attr in ("hexsha", "short_sha", "message", "author_name", "committed_datetime", "total_changes"):
+            assert getattr(lean, attr) == getattr(legacy, attr)
+        assert lean.get_file_changes() == []
+        assert lean.is_merge is False
+
     def test_get_creature_name(self):
         """Test creature name generation."""
-        commit = CommitInfo(
+        commit = CommitInfo.from_legacy(
             hash="abc",
             short_hash="abc",
             message="feat: Add new feature",
@@ -109,11 +144,35 @@ class TestGitParser:
         mock_repo.iter_commits.return_value = []
 
         parser = GitParser()
-        parser.load_repository(".")
+        parser.load_repository(".", use_cache=False)
 
         assert parser.is_loaded is True
         assert parser._repo == mock_repo
 
+    @patch("src.core.git_parser.Repo")
+    def test_load_repository_reuses_cached_repo(self, mock_repo_class):
+        """Repeated loads of the same path should not rebuild the Repo."""
+        parser = GitParser()
+        parser.load_repository(".", use_cache=False)
+        parser.load_repository(".", use_cache=False)
+
+        assert mock_repo_class.call_count == 1
+
+    @patch("src.core.git_parser.Repo")
+    def test_repo_cache_evicts_least_recently_used(self, mock_repo_class):
+        """A repo that keeps being used should survive eviction."""
+        parser = GitParser()
+        parser._max_cache_size = 2
+        mock_repo_class.side_effect = lambda path, **_: MagicMock(name=path)
+
+        hot = parser._get_repo("/repos/hot")
+        parser._get_repo("/repos/a")
+        assert parser._get_repo("/repos/hot") is hot
+        parser._get_repo("/repos/b")
+
+        assert "/repos/hot" in parser._repo_cache
+        assert "/repos/a" not in parser._repo_cache
+
     def test_load_repository_not_exists(self):
         """Test loading non-existent repository."""
         parser = GitParser()
@@ -121,6 +180,41 @@ class TestGitParser:
         with pytest.raises(Exception):  # GitError
             parser.load_repository("/nonexistent/path")
 
+    def test_relative_paths_resolve_per_working_directory(self, tmp_path, monkeypatch):
+        """"." must load whichever repository the cwd is in, not a cached one."""
+        from git_dungeon.core.git_parser import GitParser as PackagedGitParser
+
+        repos = []
+        for name in ("r1", "r2"):
+            repo_path = tmp_path / name
+            repo_path.mkdir()
+            subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+            repos.append(repo_path)
+
+        for parser_cls in (GitParser, PackagedGitParser):
+            parser = parser_cls()
+            for repo_path in repos:
+                monkeypatch.chdir(repo_path)
+                assert parser.load_repository(".", use_cache=False) is True
+                assert parser._repo.working_tree_dir == str(repo_path.resolve())
+
+    def test_load_repository_rejects_non_repositories(self, tmp_path):
+        """Missing paths and subdirectories are refused, not resolved upward."""
+        from git_dungeon.core.git_parser import GitParser as PackagedGitParser
+        from src.core.utils.exceptions import GitError
+
+        repo_path = tmp_path / "repo"
+        (repo_path / "docs").mkdir(parents=True)
+        subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+
+        packaged = PackagedGitParser()
+        assert packaged.load_repository(str(tmp_path / "missing")) is False
+        assert packaged.load_repository(str(repo_path / "docs")) is False
+        assert packaged.is_loaded is False
+
+        with pytest.raises(GitError, match="Not a Git repository"):
+            GitParser().load_repository(str(repo_path / "docs"))
+
     def test_parse_commit_message_handling(self):
         """Test commit message parsing."""
         parser = GitParser()
@@ -192,3 +286,111 @@ class TestFileChange:
         assert fc.change_type == "M"
         assert fc.additions == 10
         assert fc.deletions == 5
+
+
+class TestFileChangeStreaming:
+    """Tests for streamed file-change loading."""
+
+    def test_file_change_loaders_are_parser_methods(self):
+        """The on-demand loaders must live at class scope, not nested."""
+        from git_dungeon.core.git_parser import GitParser as PackagedGitParser
+
+        for parser_cls in (GitParser, PackagedGitParser):
+            assert callable(getattr(parser_cls, "_get_file_changes_fast", None))
+            assert callable(getattr(parser_cls, "_iter_file_changes_fast", None))
+            assert parser_cls()._get_file_changes_fast("HEAD") == []  # not loaded
+
+    def test_iter_file_changes_supports_early_stop(self, tmp_path):
+        """Consumers may stop after the first change without draining git."""
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+
+        def git(*args: str) -> str:
+            return subprocess.run(
+                ["git", *args], cwd=repo_path, check=True, capture_output=True, text=True
+            ).stdout
+
+        git("init")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test User")
+        for i in range(20):
+            (repo_path / f"file_{i}.txt").write_text(f"{i}\n", encoding="utf-8")
+        git("add", ".")
+        git("commit", "-m", "feat: add files")
+        head = git("rev-parse", "HEAD").strip()
+
+        parser = GitParser()
+        assert parser.load_repository(str(repo_path)) is True
+
+        changes = parser._iter_file_changes_fast(head)
+        first = next(changes)
+        changes.close()
+
+        assert first.change_type == "A"
+        assert first.filepath.startswith("file_")
+        assert len(parser._get_file_changes_fast(head)) == 20
+
+
+class TestHistoryCache:
+    """Tests for the on-disk commit history cache."""
+
+    def _make_repo(self, tmp_path):
+        repo_path = tmp_path / "repo"
+        repo_path.mkdir()
+
+        def git(*args: str) -> None:
+            subprocess.run(["git", *args], cwd=repo_path, check=True, capture_output=True, text=True)
+
+        git("init")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test User")
+        for i in range(3):
+            (repo_path / "story.txt").write_text(f"line {i}\n", encoding="utf-8")
+            git("add", "story.txt")
+            git("commit", "-m", f"feat: chapter {i}")
+        return repo_path
+
+    def test_history_reused_for_unchanged_head(self, tmp_path):
+        """A second parser should read history from the cache, not walk git."""
+        repo_path = self._make_repo(tmp_path)
+
+        first = GitParser()
+        first.load_repository(str(repo_path))
+        walked = first.get_commit_history()
+
+        second = GitParser()
+        second.load_repository(str(repo_path))
+        with patch.object(GitParser, "_walk_commit_history", side_effect=AssertionError):
+            cached = second.get_commit_history(limit=2, reverse=True)
+
+        assert [c.hexsha for c in cached] == [c.hexsha for c in walked[:2]][::-1]
+        assert cached[0].message == walked[1].message
+        assert cached[0].author_name == "Test User"
+
+    @pytest.mark.parametrize("payload", ["5", '[[1, 2]]', '[{"a": 1}]', json.dumps([[1] * 20])])
+    def test_malformed_history_cache_is_a_miss(self, tmp_path, payload):
+        """A cache file of the wrong shape should fall back to walking git."""
+        repo_path = self._make_repo(tmp_path)
+
+        first = GitParser()
+        first.load_repository(str(repo_path))
+        walked = first.get_commit_history()
+        (cache_file,) = (repo_path / ".git" / "git-dungeon" / "history").iterdir()
+        cache_file.write_text(payload, encoding="utf-8")
+
+        second = GitParser()
+        second.load_repository(str(repo_path))
+        commits = second.get_commit_history()
+
+        assert [c.hexsha for c in commits] == [c.hexsha for c in walked]
+        assert json.loads(cache_file.read_text(encoding="utf-8"))[0][0] == walked[0].hexsha
+
+    def test_history_cache_can_be_disabled(self, tmp_path):
+        """use_cache=False should always walk the repository."""
+        repo_path = self._make_repo(tmp_path)
+
+        parser = GitParser()
+        parser.load_repository(str(repo_path), use_cache=False)
+        parser.get_commit_history()
+
+        assert not (repo_path / ".git" / "git-dungeon").exists()
@@ -234,6 +234,17 @@ class TestItemFactory:
 
         assert item.item_type == ItemType.SPECIAL  # .md maps to SPECIAL
 
+    def test_create_from_nested_path(self):
+        """Test id and name derivation for nested and extensionless paths."""
+        item = ItemFactory.create_from_file("src/pkg/module.rs", change_count=3)
+
+        assert item.id == "item_src_pkg_module_rs"
+        assert item.name.endswith("(module.rs)")
+        assert item.item_type == ItemType.ARMOR
+
+        plain = ItemFactory.create_from_file("Makefile")
+        assert plain.item_type == ItemType.MATERIAL
+
     def test_rarity_distribution(self):
         """Test that rarity follows expected distribution."""
         import random
@@ -250,3 +261,19 @@ class TestItemFactory:
         # Check that we get a reasonable distribution
         common_count = sum(1 for r in rarities if r == ItemRarity.COMMON)
         assert common_count > 500  # Should be ~60%
+
+    def test_rarity_roll_boundaries(self):
+        """Test that a roll equal to a cumulative bound stays in that tier."""
+        from unittest.mock import patch
+
+        expected = [
+            (0.0, ItemRarity.COMMON),
+            (0.60, ItemRarity.COMMON),
+            (0.61, ItemRarity.RARE),
+            (0.90, ItemRarity.EPIC),
+            (0.97, ItemRarity.LEGENDARY),
+            (0.995, ItemRarity.CORRUPTED),
+        ]
+        for roll, rarity in expected:
+            with patch("random.random", return_value=roll):
+                assert ItemFactory.create_from_file("a.py").rarity == rarity
@@ -6,6 +6,7 @@ import os
 import json
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -38,6 +39,149 @@ class TestLuaEngine:
         assert engine is not None
         assert "default" in engine.themes
 
+    @pytest.mark.skipif(not LUA_AVAILABLE, reason="Lua not available")
+    def test_engine_reports_backend(self):
+        """Test the selected lupa backend is exposed and usable."""
+        from src.core.lua import parse_lua_table
+
+        engine = LuaEngine()
+        assert engine.LUA_IMPL is not None
+        assert engine.LUA_IMPL.startswith("lupa")
+
+        success, table = engine.execute("return {name = 'Boss', stats = {hp = 10}}")
+        assert success is True
+        assert parse_lua_table(table) == {"name": "Boss", "stats": {"hp": 10}}
+
+    @pytest.mark.skipif(not LUA_AVAILABLE, reason="Lua not available")
+    def test_api_namespaces_are_lua_tables(self):
+        """Test the content APIs are bound as native Lua tables."""
+        engine = LuaEngine()
+        engine.add_monster(MonsterTemplate(name="Bug", base_hp=3))
+
+        success, result = engine.execute(
+            "return type(Monster), type(DropTable), type(Theme), Monster.get('Bug').base_hp"
+        )
+        assert success is True
+        assert result == ("table", "table", "table", 3)
+
+    def test_lua_print_skips_formatting_when_debug_disabled(self):
+        """Test script output is only stringified when debug logging is on."""
+        from src.core.lua import lua_engine
+
+        class Loud:
+            calls = 0
+
+            def __str__(self):
+                Loud.calls += 1
+                return "loud"
+
+        engine = LuaEngine()
+        with patch.object(lua_engine.logger, "isEnabledFor", return_value=False):
+            engine._log_function(Loud())
+        assert Loud.calls == 0
+
+        with patch.object(lua_engine.logger, "isEnabledFor", return_value=True), \
+                patch.object(lua_engine.logger, "debug") as debug:
+            engine._log_function(Loud(), 1)
+        debug.assert_called_once_with("[Lua] %s", "loud 1")
+
+    @pytest.mark.skipif(not LUA_AVAILABLE, reason="Lua not available")
+    def test_parse_lua_table_handles_deep_nesting(self):
+        """Test table conversion does not recurse per nesting level."""
+        from src.core.lua import lua_table_to_list, parse_lua_table
+
+        engine = LuaEngine()
+        depth = sys.getrecursionlimit() + 100
+        success, table = engine.execute(
+            f"local t = {{leaf = true}} for i = 1, {depth} do t = {{child = t}} end return t"
+        )
+        assert success is True
+
+        node = parse_lua_table(table)
+        for _ in range(depth):
+            node = node["child"]
+        assert node == {"leaf": True}
+
+        success, items = engine.execute("return {'a', {hp = 1}}")
+        assert lua_table_to_list(items) == ["a", {"hp": 1}]
+
+    @pytest.mark.skipif(not LUA_AVAILABLE, reason="Lua not available")
+    def test_parse_lua_table_handles_cycles(self):
+        """Test self-referencing and shared tables convert to shared dicts."""
+        from src.core.lua import lua_table_to_list, parse_lua_table
+
+        engine = LuaEngine()
+        success, table = engine.execute(
+            "local t = {name = 'loop'} t.self = t t.child = {parent = t} return t"
+        )
+        assert success is True
+
+        node = parse_lua_table(table)
+        assert node["self"] is node
+        assert node["child"]["parent"] is node
+        assert node["name"] == "loop"
+
+        success, items = engine.execute(
+            "local s = {hp = 1} s.me = s return {s, s}"
+        )
+        first, second = lua_table_to_list(items)
+        assert first is second
+        assert first["me"] is first and first["hp"] == 1
+
+    @pytest.mark.skipif(not LUA_AVAILABLE, reason="Lua not available")
+    def test_load_file_reuses_compiled_chunk(self, tmp_path):
+        """Test Lua files compile once and bytecode survives a new engine."""
+        script = tmp_path / "monsters.lua"
+        script.write_text("loaded_count = (loaded_count or 0) + 1", encoding="utf-8")
+        cache_dir = tmp_path / "luac"
+
+        engine = LuaEngine(bytecode_cache_dir=cache_dir)
+        assert engine.load_file(str(script))[0] is True
+        assert engine.load_file(str(script))[0] is True
+        assert engine.lua.globals().loaded_count == 2
+        assert len(engine._chunk_cache) == 1
+        assert len(list(cache_dir.glob("*.luac"))) == 1
+
+        from unittest.mock import patch
+
+        fresh = LuaEngine(bytecode_cache_dir=cache_dir)
+        with patch.object(Path, "read_text", side_effect=AssertionError("source re-read")):
+            assert fresh.load_file(str(script))[0] is True
+        assert fresh.lua.globals().loaded_count == 1
+
+    @pytest.mark.skipif(not LUA_AVAILABLE, reason="Lua not available")
+    def test_edited_file_replaces_its_cache_entry(self, tmp_path):
+        """Test editing a script recompiles it in place instead of adding entries."""
+        script = tmp_path / "monsters.lua"
+        cache_dir = tmp_path / "luac"
+        engine = LuaEngine(bytecode_cache_dir=cache_dir)
+
+        for version in range(3):
+            script.write_text(f"script_version = {version}" + " " * version, encoding="utf-8")
+            assert engine.load_file(str(script))[0] is True
+            assert engine.lua.globals().script_version == version
+
+        assert len(engine._chunk_cache) == 1
+        assert len(list(cache_dir.glob("*.luac"))) == 1
+
+        fresh = LuaEngine(bytecode_cache_dir=cache_dir)
+        with patch.object(Path, "read_text", side_effect=AssertionError("source re-read")):
+            assert fresh.load_file(str(script))[0] is True
+        assert fresh.lua.globals().script_version == 2
+
+    @pytest.mark.skipif(not LUA_AVAILABLE, reason="Lua not available")
+    def test_load_file_reports_syntax_error(self, tmp_path):
+        """Test a Lua syntax error is reported, not cached."""
+        script = tmp_path / "broken.lua"
+        script.write_text("Monster.define(", encoding="utf-8")
+
+        engine = LuaEngine(bytecode_cache_dir=tmp_path / "luac")
+        success, message = engine.load_file(str(script))
+
+        assert success is False
+        assert "broken.lua" in message
+        assert engine._chunk_cache == {}
+
     @pytest.mark.skipif(LUA_AVAILABLE, reason="Lua is available, skip Lua-unavailable test")
     def test_engine_no_lua_fallback(self):
         """Test engine works without Lua runtime."""
@@ -143,6 +287,82 @@ class TestLuaEngine:
         finally:
             os.unlink(temp_path)
 
+    def test_filter_monsters_by_stats(self, tmp_path):
+        """Test stat filtering over monsters loaded from JSON."""
+        engine = LuaEngine()
+        path = tmp_path / "monsters.json"
+        path.write_text(json.dumps({
+            "Rat": {"hp": 20, "attack": 5},
+            "Ogre": {"hp": 300, "attack": 40},
+            "Imp": {"hp": 40, "attack": 25, "speed": 30},
+        }), encoding="utf-8")
+        engine.load_file(str(path))
+
+        assert engine.filter_monsters(base_attack=20) == ["Ogre", "Imp"]
+        assert engine.filter_monsters(base_attack=20, speed=20) == ["Imp"]
+
+        engine.add_monster(MonsterTemplate(name="Rat", base_attack=50))
+        assert engine.filter_monsters(base_attack=45) == ["Rat"]
+
+        engine.monsters["Imp"].speed = 5
+        assert engine.filter_monsters(speed=20) == []
+
+        engine.add_monster(MonsterTemplate(name="Odd", base_hp="lots"))  # type: ignore[arg-type]
+        assert "Odd" in engine.monsters
+
+        with pytest.raises(ValueError):
+            engine.filter_monsters(name=1)
+
+    def test_json_monster_matches_constructor(self, tmp_path):
+        """Test JSON-built monsters equal keyword-constructed ones."""
+        path = tmp_path / "monsters.json"
+        path.write_text(json.dumps({
+            "Rat": {"base_hp": 20, "attack": 5, "skills": ["bite"], "theme": "sewer"},
+            "Ghost": {"hp": 7, "base_hp": 99},
+        }), encoding="utf-8")
+        engine = LuaEngine()
+        assert engine.load_file(str(path))[0] is True
+
+        expected = MonsterTemplate(name="Rat", base_hp=20, base_attack=5, skills=["bite"], theme="sewer")
+        assert engine.monsters["Rat"].to_dict() == expected.to_dict()
+        assert engine.monsters["Ghost"].base_hp == 7
+        assert engine.monsters["Ghost"].skills == []
+        assert engine.monsters["Ghost"].skills is not MonsterTemplate(name="x").skills
+
+    def test_large_json_is_streamed_when_ijson_available(self, tmp_path, monkeypatch):
+        """Test files over the threshold are registered entry by entry."""
+        from types import SimpleNamespace
+        from src.core.lua import lua_engine
+
+        seen = []
+
+        def kvitems(f, prefix, use_float=False):
+            for item in json.load(f).items():
+                seen.append(item[0])
+                yield item
+
+        monkeypatch.setattr(lua_engine, "ijson", SimpleNamespace(kvitems=kvitems))
+        monkeypatch.setattr(lua_engine, "JSON_STREAM_MIN_BYTES", 0)
+        path = tmp_path / "monsters.json"
+        path.write_text(json.dumps({"Rat": {"hp": 20}, "Ogre": {"hp": 300}}), encoding="utf-8")
+
+        engine = LuaEngine()
+        assert engine.load_file(str(path))[0] is True
+        assert seen == ["Rat", "Ogre"]
+        assert engine.get_monster("Ogre").base_hp == 300
+
+    def test_monster_api_random_samples_registered_names(self):
+        """Test Monster.random picks from registered monsters without copying keys."""
+        engine = LuaEngine()
+        api = engine._create_monster_api()
+        assert api["random"]() is None
+
+        for name in ("Rat", "Imp", "Ogre"):
+            engine.add_monster(MonsterTemplate(name=name))
+        with patch("random.randrange", return_value=2) as randrange:
+            assert api["random"]()["name"] == "Ogre"
+        randrange.assert_called_once_with(3)
+
     def test_load_json_droptables(self):
         """Test loading drop tables from JSON file."""
         engine = LuaEngine()
@@ -205,6 +425,21 @@ class TestLuaEngine:
             assert "DirMonster" in engine.monsters
             assert "DirTheme" in engine.themes
 
+    def test_load_directory_json_in_name_order(self, tmp_path):
+        """Test parallel-decoded JSON files register in file-name order."""
+        for i in range(6):
+            (tmp_path / f"pack_{i}.json").write_text(
+                json.dumps({"Slime": {"hp": i * 10}, f"Mob{i}": {"hp": 1}}), encoding="utf-8"
+            )
+        (tmp_path / "pack_9.json").write_text("{not json", encoding="utf-8")
+
+        engine = LuaEngine()
+        loaded, failed = engine.load_directory(str(tmp_path))
+
+        assert (loaded, failed) == (6, 1)
+        assert engine.get_monster("Slime").base_hp == 50
+        assert list(engine.monsters)[:2] == ["Slime", "Mob0"]
+
     def test_get_monster(self):
         """Test get_monster method."""
         engine = LuaEngine()
@@ -217,6 +452,16 @@ class TestLuaEngine:
         monster = engine.get_monster("GetMonster")
         assert monster is not None
         assert monster.base_hp == 100
+        assert engine.get_monster("Missing") is None
+
+    def test_registered_names_are_interned(self):
+        """Test names built at runtime resolve to the interned registry key."""
+        engine = LuaEngine()
+        engine.add_monster(MonsterTemplate(name="".join(["Null", "Pointer"])))
+
+        key = next(iter(engine.monsters))
+        assert key is sys.intern("NullPointer")
+        assert engine.monsters[key].name is key
 
     def test_get_drop_table(self):
         """Test get_drop_table method."""
@@ -288,6 +533,20 @@ class TestLuaEngine:
                 data = json.load(f)
                 assert "ExportMonster" in data
 
+    def test_export_keeps_unicode_readable(self, tmp_path):
+        """Test exported JSON is indented UTF-8 and loads back unchanged."""
+        engine = LuaEngine()
+        engine.themes["dragon"] = Theme(id="dragon", name="龙穴", icon="🐉", color_scheme="red")
+
+        engine.export_content(str(tmp_path))
+        raw = (tmp_path / "themes.json").read_text(encoding="utf-8")
+        assert "龙穴" in raw
+        assert '\n  "dragon"' in raw
+
+        reloaded = LuaEngine()
+        assert reloaded.load_file(str(tmp_path / "themes.json"))[0] is True
+        assert reloaded.themes["dragon"].name == "龙穴"
+
 
 class TestMonsterTemplate:
     """Tests for MonsterTemplate class."""
@@ -306,6 +565,18 @@ class TestMonsterTemplate:
         assert monster.base_hp == 100
         assert monster.experience == 50
 
+    def test_content_records_are_slotted(self):
+        """Test content records carry no per-instance __dict__."""
+        records = [
+            MonsterTemplate(name="Slim"),
+            DropEntry(item_id="gem"),
+            DropTable(name="loot"),
+            Theme(id="t", name="T"),
+        ]
+        for record in records:
+            assert not hasattr(record, "__dict__")
+        assert MonsterTemplate(name="a").skills is not MonsterTemplate(name="b").skills
+
     def test_monster_to_dict(self):
         """Test converting monster to dictionary."""
         monster = MonsterTemplate(
@@ -321,6 +592,39 @@ class TestMonsterTemplate:
         assert "attack" in data["skills"]
 
 
+    def test_to_dict_is_memoized_until_mutation(self):
+        """Test to_dict() is reused and rebuilt after a field changes."""
+        monster = MonsterTemplate(name="Cached", base_hp=10)
+        assert monster._dict_cache is None
+        first = monster.to_dict()
+        assert monster.to_dict() == first
+        assert monster._dict_cache is not None
+
+        monster.base_hp = 99
+        assert monster._dict_cache is None
+        rebuilt = monster.to_dict()
+        assert rebuilt["base_hp"] == 99
+
+        table = DropTable(name="loot")
+        before = table.to_dict()
+        table.guaranteed.append(DropEntry(item_id="gem"))
+        table._invalidate()
+        assert before["guaranteed"] == []
+        assert table.to_dict()["guaranteed"][0]["item_id"] == "gem"
+
+    def test_to_dict_edits_do_not_leak_into_cache(self):
+        """Test a caller editing its dict leaves the record's dict intact."""
+        monster = MonsterTemplate(name="Scaled", base_hp=10, skills=["bite"])
+        scaled = monster.to_dict()
+        scaled["base_hp"] *= 3
+        assert monster.to_dict()["base_hp"] == monster.base_hp == 10
+        assert monster.to_dict()["skills"] is monster.skills
+
+        table = DropTable(name="loot", entries=[DropEntry(item_id="gem", chance=0.5)])
+        table.to_dict()["entries"][0]["chance"] = 1.0
+        assert table.to_dict()["entries"][0]["chance"] == 0.5
+
+
 class TestDropTable:
     """Tests for DropTable class."""
 
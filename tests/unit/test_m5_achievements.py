@@ -167,6 +167,20 @@ class TestAchievementManager:
         newly_unlocked = manager.check_and_unlock("chapters_completed", 5)
         assert len(newly_unlocked) == 0
     
+    def test_check_and_unlock_matches_full_scan(self):
+        """测试按条件类型索引的结果与全量扫描一致"""
+        condition_types = {ach.condition_type for ach in ACHIEVEMENT_DEFINITIONS.values()}
+
+        for condition_type in condition_types:
+            for value in (0, 1, 5, 1000):
+                expected = [
+                    ach_id for ach_id, ach in ACHIEVEMENT_DEFINITIONS.items()
+                    if ach.condition_type == condition_type and ach.check_condition(value)
+                ]
+                assert AchievementManager().check_and_unlock(condition_type, value) == expected
+
+        assert AchievementManager().check_and_unlock("no_such_condition", 100) == []
+
     def test_update_stat(self):
         """测试统计更新"""
         manager = AchievementManager()
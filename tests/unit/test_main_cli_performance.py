@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+from pathlib import Path
 from types import SimpleNamespace
 
 from git_dungeon.engine import GameState
@@ -36,3 +40,16 @@ def test_get_current_commit_uses_cached_history() -> None:
 
     assert dummy_parser.calls == 1
 
+
+def test_cli_import_skips_reward_and_archetype_rules() -> None:
+    """Importing the CLI should not load rule modules it never uses."""
+    src = Path(__file__).resolve().parents[2] / "src"
+    code = (
+        "import sys, git_dungeon.main_cli, git_dungeon.engine as engine\n"
+        "assert 'git_dungeon.engine.rules.rewards' not in sys.modules\n"
+        "assert 'git_dungeon.engine.rules.archetype' not in sys.modules\n"
+        "assert engine.RewardsEngine.__module__ == 'git_dungeon.engine.rules.rewards'\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(src), os.environ.get("PYTHONPATH")]))}
+
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
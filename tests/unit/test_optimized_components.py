@@ -0,0 +1,154 @@
+"""Unit tests for optimized_components module."""
+
+from git_dungeon.core.optimized_components import (
+    CharacterPool,
+    CharacterStats,
+    CharacterType,
+    OptimizedCharacter,
+    Stat,
+    StatType,
+    StatusEffect,
+    StatusEffectType,
+)
+
+
+class TestCharacterStatsSums:
+    """Tests for stat sums following stat changes."""
+
+    def test_total_tracks_modifier_changes(self):
+        """Test total() reflects every stat change."""
+        stats = CharacterStats(hp=100, mp=50, attack=20, defense=10, speed=10)
+        assert stats.total() == 190
+
+        stats.attack.add_modifier(5)
+        assert stats.total() == 195
+
+        stats.attack.remove_modifier(5)
+        stats.defense.base_value = 20
+        assert stats.total() == 200
+
+        stats.defense.modifier = 3
+        stats.reset()
+        assert stats.total() == 200
+
+    def test_power_level_tracks_modifier_changes(self):
+        """Test get_power_level() follows buffs on the owned stats."""
+        char = OptimizedCharacter(CharacterType.PLAYER, "Dev")
+        assert char.get_power_level() == 0
+
+        char.initialize_stats(hp=100, attack=20, defense=10, speed=10)
+        assert char.get_power_level() == 50
+
+        char.stats.speed.add_modifier(4)
+        assert char.get_power_level() == 54
+
+    def test_stats_are_indexed_by_stat_type(self):
+        """Test value() reads the same Stat objects as attribute access."""
+        stats = CharacterStats(hp=80, luck=7)
+        stats.luck.add_modifier(3)
+
+        assert stats.value(StatType.LUCK) == 10
+        assert stats.value(StatType.HP) == stats.hp.value == 80
+        assert stats.copy().value(StatType.LUCK) == 7
+        assert stats.hp is stats.hp
+
+        stats.speed = Stat(40, 2)
+        assert stats.value(StatType.SPEED) == 42
+
+    def test_reset_clears_every_modifier(self):
+        """Test reset() zeroes modifiers on all eight stats."""
+        stats = CharacterStats()
+        stats.critical.add_modifier(4)
+        stats.hp.add_modifier(6)
+        assert stats.total() == 181
+
+        stats.reset()
+        assert all(stats.value(stat) == CharacterStats().value(stat) for stat in StatType)
+        assert stats.total() == 175
+
+    def test_unowned_stat_copy(self):
+        """Test a copied stat is detached from the original container."""
+        stats = CharacterStats(attack=20)
+        detached = stats.attack.copy()
+        detached.add_modifier(100)
+
+        assert isinstance(detached, Stat)
+        assert stats.attack.value == 20
+        assert stats.total() == 100 + 50 + 20 + 5 + 10
+
+
+class TestCharacterCombat:
+    """Tests for damage and experience handling."""
+
+    def test_take_damage_applies_halved_defense(self):
+        """Test damage is reduced by half defense but is at least 1."""
+        char = OptimizedCharacter(CharacterType.MONSTER, "Bug")
+        char.initialize_stats(hp=30, defense=10)
+
+        assert char.take_damage(25) == 20
+        assert char.take_damage(3) == 1
+        assert char.current_hp == 9
+        assert char.is_alive is True
+
+    def test_take_damage_clamps_at_zero(self):
+        """Test lethal damage clamps hp and marks the character dead."""
+        char = OptimizedCharacter(CharacterType.MONSTER, "Bug")
+        char.initialize_stats(hp=10, defense=0)
+
+        assert char.take_damage(50) == 10
+        assert char.current_hp == 0
+        assert char.is_alive is False
+        assert char.take_damage(5) == 0
+
+    def test_gain_experience_levels_through_thresholds(self):
+        """Test a lump experience reward can cross several levels."""
+        char = OptimizedCharacter(CharacterType.PLAYER, "Dev")
+
+        remaining, leveled_up = char.gain_experience(100 + 400 + 50)
+
+        assert leveled_up is True
+        assert char.level == 3
+        assert remaining == 50
+        assert char.experience_to_next == 900
+        assert char.get_level_info()["total_exp"] == 550
+        assert char.gain_experience(10) == (60, False)
+
+    def test_exp_needed_table_matches_formula(self):
+        """Test the precomputed thresholds agree with level^2 * 100."""
+        for level in (1, 7, 1023, 1024, 5000):
+            char = OptimizedCharacter(CharacterType.PLAYER, "Dev", level=level)
+            assert char.experience_to_next == level * level * 100
+
+    def test_take_damage_ignores_dead_target(self):
+        """Test a dead character takes no damage and stays dead."""
+        char = OptimizedCharacter(CharacterType.MONSTER, "Bug")
+        char.initialize_stats(hp=10, defense=0)
+        char.is_alive = False
+
+        assert char.take_damage(5) == 0
+        assert char.current_hp == 10
+        assert char.is_alive is False
+
+
+class TestCharacterPool:
+    """Tests for pooled character reuse."""
+
+    def test_reserve_then_get_reuses_containers(self):
+        """Test reserved characters are handed out with their effect list reused."""
+        CharacterPool._pool.clear()
+        CharacterPool.reserve(3)
+        assert len(CharacterPool._pool) == 3
+
+        char = CharacterPool.get(CharacterType.MONSTER, "Wave")
+        effects = char.status_effects
+        effects.append(StatusEffect(StatusEffectType.POISON, duration=2))
+        char.is_alive = False
+        CharacterPool.release(char)
+
+        again = CharacterPool.get(CharacterType.PLAYER, "Dev")
+        assert again is char
+        assert again.status_effects is effects
+        assert again.status_effects == []
+        assert again.is_alive is True
+        assert again.name == "Dev"
+        CharacterPool._pool.clear()
@@ -0,0 +1,373 @@
+"""Unit tests for optimized_git_parser module."""
+
+import json
+import os
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from git_dungeon.core import optimized_git_parser
+from git_dungeon.core.numstat_parser import parse_git_log
+from git_dungeon.core.optimized_git_parser import CommitInfo, OptimizedGitParser
+
+
+def _make_repo(tmp_path):
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=repo_path, check=True, capture_output=True, text=True)
+
+    git("init", "-b", "main")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test User")
+
+    (repo_path / "story.txt").write_text("line 1\nline 2\n", encoding="utf-8")
+    git("add", ".")
+    git("commit", "-m", "feat: add story\n\nWith a body.")
+
+    (repo_path / "logo.bin").write_bytes(bytes(range(256)))
+    git("mv", "story.txt", "tale.txt")
+    git("add", ".")
+    git("commit", "-m", "refactor: rename story")
+
+    git("checkout", "-b", "side")
+    (repo_path / "side.txt").write_text("a\nb\nc\n", encoding="utf-8")
+    git("add", ".")
+    git("commit", "-m", "fix: side change")
+
+    git("checkout", "main")
+    (repo_path / "tale.txt").write_text("line 1\n", encoding="utf-8")
+    git("commit", "-am", "fix: trim tale")
+    git("merge", "--no-ff", "side", "-m", "Merge branch 'side'")
+    return repo_path
+
+
+class TestGitLogHistory:
+    """Tests for the single-subprocess history reader."""
+
+    def test_history_matches_gitpython_stats(self, tmp_path):
+        """Test git log parsing gives the same records as per-commit parsing."""
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path))
+
+        commits = parser.get_commit_history()
+        expected = [parser.parse_commit(c) for c in parser._repo.iter_commits()]
+
+        assert commits == expected
+        assert commits[0].message == "Merge branch 'side'"
+        assert commits[0].files_changed == 1
+        assert commits[-1].message == "feat: add story\n\nWith a body."
+
+    def test_libgit2_stats_match_gitpython(self, tmp_path):
+        """Test the optional pygit2 backend agrees with commit.stats."""
+        pytest.importorskip("pygit2")
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path))
+
+        for commit in parser._repo.iter_commits():
+            totals = commit.stats.total
+            assert parser._libgit2_stats(commit.hexsha) == (
+                totals["insertions"], totals["deletions"], len(commit.stats.files)
+            )
+
+    def test_author_fields_are_interned(self, tmp_path):
+        """Test commits share one author string object, from git and from the disk cache."""
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path))
+        walked = parser.get_commit_history()
+        cached = parser._load_commit_cache(parser._repo.head.commit.hexsha, None)
+
+        for history in (walked, cached):
+            assert len({id(c.author_name) for c in history}) == 1
+            assert len({id(c.author_email) for c in history}) == 1
+        assert cached[0].author_name is walked[0].author_name
+
+    def test_unreadable_commit_returns_shared_sentinel(self):
+        """Test parse failures return the one immutable unknown commit."""
+        parser = OptimizedGitParser()
+        broken = MagicMock(message=None)
+
+        first = parser.parse_commit(broken)
+
+        assert first is optimized_git_parser._UNKNOWN_COMMIT
+        assert parser.parse_commit(broken) is first
+        assert first.creature_name == "Unknown"
+
+    def test_history_limit_and_reverse(self, tmp_path):
+        """Test limit keeps the newest commits and reverse flips them."""
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path))
+
+        newest = parser.get_commit_history(limit=2)
+        oldest_first = parser.get_commit_history(limit=2, reverse=True)
+
+        assert len(newest) == 2
+        assert oldest_first == newest[::-1]
+
+    def test_reverse_reuses_parsed_orientation(self, tmp_path):
+        """Test reverse order is flipped from memory without touching git or disk."""
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path), use_cache=False)
+        oldest_first = parser.get_commit_history(reverse=True)
+
+        with patch.object(OptimizedGitParser, "_read_git_log", side_effect=AssertionError):
+            newest = parser.get_commit_history()
+
+        assert newest == oldest_first[::-1]
+        assert newest[0].message == "Merge branch 'side'"
+
+
+class TestNumstatParser:
+    """Tests for the standalone git log --numstat parser."""
+
+    def test_records_sum_text_and_skip_binary_counts(self):
+        """Test per-record totals count binary files but not their lines."""
+        output = (
+            "\x01" + "a" * 40 + "\x1fDev\x1fdev@example.com\x1f2024-01-01T00:00:00+00:00\x1ffeat: x\n\x1e\n"
+            "3\t1\tsrc/a.py\n-\t-\tlogo.png\n2\t0\tsrc/b.py\n\n"
+            "\x01" + "b" * 40 + "\x1fDev\x1fdev@example.com\x1f2024-01-02T00:00:00+00:00\x1fchore: empty\n\x1e"
+        )
+
+        first, second = parse_git_log(output)
+
+        assert first == (
+            "a" * 40, "Dev", "dev@example.com", "2024-01-01T00:00:00+00:00", "feat: x\n", 5, 1, 3
+        )
+        assert second[5:] == (0, 0, 0)
+
+
+class TestCommitCache:
+    """Tests for the on-disk history cache."""
+
+    def test_history_reused_for_unchanged_head(self, tmp_path):
+        """Test a new parser reads history from disk instead of running git."""
+        repo_path = _make_repo(tmp_path)
+        first = OptimizedGitParser()
+        first.load_repository(str(repo_path))
+        walked = first.get_commit_history(limit=3)
+
+        second = OptimizedGitParser()
+        second.load_repository(str(repo_path))
+        with patch.object(OptimizedGitParser, "_read_git_log", side_effect=AssertionError):
+            assert second.get_commit_history(limit=3) == walked
+
+    def test_least_recently_used_entries_evicted(self, tmp_path, monkeypatch):
+        """Test only the newest COMMIT_CACHE_ENTRIES histories are kept."""
+        monkeypatch.setattr(optimized_git_parser, "COMMIT_CACHE_ENTRIES", 2)
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path))
+
+        cache_dir = repo_path / ".git" / "git-dungeon" / "commits"
+        for limit in (1, 2, 3):
+            for path in cache_dir.glob("*.json"):  # age earlier entries
+                st = path.stat()
+                os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 10**10))
+            parser.get_commit_history(limit=limit)
+
+        cached = sorted(p.name.rsplit("-", 1)[1] for p in cache_dir.iterdir())
+        assert cached == ["2.json", "3.json"]
+
+    def test_malformed_cache_is_a_miss(self, tmp_path):
+        """Test valid JSON of the wrong shape is rebuilt from git."""
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path))
+        expected = parser.get_commit_history()
+        path = parser._commit_cache_path(parser._repo.head.commit.hexsha, None)
+
+        for bad in ({"rows": []}, [1, 2], [["a", "b"]], [{"hexsha": "a"}], [["a"] * 12]):
+            path.write_text(json.dumps(bad), encoding="utf-8")
+            assert parser._load_commit_cache(parser._repo.head.commit.hexsha, None) is None
+            assert parser.get_commit_history() == expected
+
+    def test_disk_cache_can_be_disabled(self, tmp_path):
+        """Test use_cache=False always runs git and writes nothing."""
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path), use_cache=False)
+        parser.get_commit_history()
+
+        assert not (repo_path / ".git" / "git-dungeon").exists()
+
+
+class TestCreatureName:
+    """Tests for commit-message creature names."""
+
+    def test_prefixes_match_like_startswith(self):
+        """Test known prefixes map by message head, case-insensitively."""
+        cases = {
+            "feat: add": "Feature",
+            "Feature flags": "Feature",
+            "FIX(parser): crash": "Bug",
+            "refactoring": "Refactor",
+            "cinema mode": "CI",
+            "Merged PR": "Merge",
+            "build(deps): bump": "Build",
+            "Update README": "Update",
+            "   ": "Unknown",
+        }
+        for message, expected in cases.items():
+            commit = CommitInfo("a" * 40, "a" * 8, message, "Dev", "dev@example.com", "", 0, 0, 0)
+            assert commit.creature_name == expected, message
+            assert commit.get_creature_name() == expected, message
+
+    def test_commit_info_is_slotted_and_hashable(self):
+        """Test commit records are immutable values usable for dedup."""
+        commit = CommitInfo("a" * 40, "a" * 8, "fix: x", "Dev", "dev@example.com", "", 1, 2, 3)
+        twin = CommitInfo("a" * 40, "a" * 8, "fix: x", "Dev", "dev@example.com", "", 1, 2, 3)
+
+        assert not hasattr(commit, "__dict__")
+        assert len({commit, twin}) == 1
+        with pytest.raises(AttributeError):
+            commit.message = "changed"
+
+
+class TestCommitColumns:
+    """Tests for the column-oriented history."""
+
+    def test_columns_match_row_history(self, tmp_path):
+        """Test SoA columns carry the same per-commit numbers as CommitInfo rows."""
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path), use_cache=False)
+
+        rows = parser.get_commit_history()
+        columns = parser.get_commit_history_soa()
+
+        assert len(columns) == len(rows)
+        assert columns.hexsha == [c.hexsha for c in rows]
+        assert list(columns.additions) == [c.additions for c in rows]
+        assert sum(columns.deletions) == sum(c.deletions for c in rows)
+        assert columns.commits_per_author() == {"Test User": len(rows)}
+        assert len(parser.get_commit_history_soa(limit=2)) == 2
+
+
+class TestRepositoryLimits:
+    """Tests for the repository size guard."""
+
+    def test_oversized_repository_rejected(self, tmp_path):
+        """Test load_repository refuses a history above twice max_commits."""
+        from git_dungeon.config import GameConfig
+
+        repo_path = _make_repo(tmp_path)
+
+        with pytest.raises(optimized_git_parser.ResourceLimitError):
+            OptimizedGitParser(GameConfig(max_commits=2)).load_repository(str(repo_path))
+        OptimizedGitParser(GameConfig(max_commits=3)).load_repository(str(repo_path))
+
+    def test_uncountable_repository_rejected(self, tmp_path):
+        """Test a commit count that times out is reported as too large."""
+        repo_path = _make_repo(tmp_path)
+        timeout = subprocess.TimeoutExpired(["git", "rev-list"], 5)
+
+        with patch.object(OptimizedGitParser, "_run_git", side_effect=timeout):
+            with pytest.raises(optimized_git_parser.ResourceLimitError):
+                OptimizedGitParser().load_repository(str(repo_path))
+
+    def test_empty_repository_is_not_too_large(self, tmp_path):
+        """Test a repository without commits passes the size guard."""
+        subprocess.run(["git", "init", str(tmp_path)], check=True, capture_output=True)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(tmp_path))
+
+        assert parser.get_commit_history() == []
+
+    def test_git_commands_target_the_git_dir(self, tmp_path, monkeypatch):
+        """Test subprocess helpers address the object store, not the cwd."""
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path))
+        monkeypatch.chdir(tmp_path)
+
+        result = parser._run_git("rev-parse", "--absolute-git-dir")
+
+        assert result.stdout.decode().strip() == str(repo_path / ".git")
+        assert len(parser.get_commit_history(limit=2)) == 2
+
+
+class TestParallelGitLog:
+    """Tests for splitting history across git log workers."""
+
+    def test_parallel_slices_match_single_log(self, tmp_path, monkeypatch):
+        """Test sliced history keeps order and stats of a single git log."""
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path), use_cache=False)
+        single = parser._read_git_log()
+
+        monkeypatch.setattr(optimized_git_parser, "PARALLEL_LOG_MIN_COMMITS", 2)
+        monkeypatch.setattr(optimized_git_parser.os, "cpu_count", lambda: 4)
+        with patch.object(OptimizedGitParser, "_run_git", wraps=parser._run_git) as run_git:
+            sliced = parser._read_git_log()
+
+        assert sliced == single
+        assert sum(call.args[0] == "log" for call in run_git.call_args_list) == 3
+
+
+class TestRepoCache:
+    """Tests for the class-level Repo cache."""
+
+    def test_recently_used_repo_survives_eviction(self, monkeypatch):
+        """Test eviction follows recency and closes the evicted repo."""
+        monkeypatch.setattr(OptimizedGitParser, "_repo_cache", optimized_git_parser.OrderedDict())
+        monkeypatch.setattr(OptimizedGitParser, "_max_cache_size", 2)
+        with patch.object(optimized_git_parser, "Repo", side_effect=lambda path, **_: MagicMock(name=path)):
+            hot = OptimizedGitParser._get_repo("/repos/hot")
+            cold = OptimizedGitParser._get_repo("/repos/cold")
+            assert OptimizedGitParser._get_repo("/repos/hot") is hot
+            OptimizedGitParser._get_repo("/repos/new")
+
+        assert list(OptimizedGitParser._repo_cache) == ["/repos/hot", "/repos/new"]
+        cold.close.assert_called_once_with()
+        hot.close.assert_not_called()
+
+
+class TestGitLogFast:
+    """Tests for the streamed subprocess log helpers."""
+
+    def test_fields_survive_pipes_and_early_stop(self, tmp_path):
+        """Test '|' stays inside fields and closing the generator stops git."""
+        repo_path = _make_repo(tmp_path)
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "fix: a|b|c"],
+            cwd=repo_path, check=True, capture_output=True,
+        )
+
+        entries = optimized_git_parser.iter_git_log_fast(str(repo_path), limit=10)
+        first = next(entries)
+        entries.close()
+
+        assert first["message"] == "fix: a|b|c"
+        assert first["author"] == "Test User"
+        assert len(optimized_git_parser.get_git_log_fast(str(repo_path), limit=3)) == 3
+        assert optimized_git_parser.get_git_log_fast(str(tmp_path / "missing")) == []
+
+    def test_commit_diff_reads_shortstat(self, tmp_path):
+        """Test additions/deletions come from the one-line shortstat summary."""
+        repo_path = _make_repo(tmp_path)
+
+        assert optimized_git_parser.get_commit_diff_fast(str(repo_path), "HEAD^1") == (0, 1)
+        assert optimized_git_parser.get_commit_diff_fast(str(repo_path), "HEAD^2") == (3, 0)
+
+    def test_commit_diffs_batch_matches_history(self, tmp_path):
+        """Test one batched git log gives each commit's history stats."""
+        repo_path = _make_repo(tmp_path)
+        parser = OptimizedGitParser()
+        parser.load_repository(str(repo_path), use_cache=False)
+        commits = parser.get_commit_history()
+
+        shas = [c.hexsha for c in reversed(commits)] + [commits[0].short_sha]
+        diffs = optimized_git_parser.get_commit_diffs_batch(str(repo_path), shas)
+
+        assert list(diffs) == shas[:-1]
+        for commit in commits:
+            assert diffs[commit.hexsha] == (commit.additions, commit.deletions, commit.files_changed)
+        assert optimized_git_parser.get_commit_diffs_batch(str(repo_path), ["0" * 40]) == {}
@@ -0,0 +1,84 @@
+"""Unit tests for resource_manager module."""
+
+from unittest.mock import MagicMock
+
+from git_dungeon.core import resource_manager
+from git_dungeon.core.resource_manager import ChunkedLoader, ResourceManager
+
+
+class TestProcessSampling:
+    """Tests for psutil process sampling."""
+
+    def test_stats_reuse_one_process_handle(self):
+        """Test repeated stats reads do not rebuild the psutil handle."""
+        manager = ResourceManager()
+        process = resource_manager._current_process()
+
+        assert manager.stats.memory_mb > 0
+        assert manager.stats.last_gc_time == 0.0
+        assert resource_manager._current_process() is process
+
+    def test_cpu_percent_read_against_primed_baseline(self, monkeypatch):
+        """Test the handle is primed once and stats never block on cpu_percent."""
+        import psutil
+
+        process = MagicMock(pid=resource_manager.os.getpid())
+        process.memory_info.return_value.rss = 0
+        monkeypatch.setattr(resource_manager, "_process", None)
+        monkeypatch.setattr(psutil, "Process", MagicMock(return_value=process))
+
+        ResourceManager().stats
+        ResourceManager().stats
+
+        assert process.cpu_percent.call_count == 3
+        assert all(c.kwargs == {"interval": None} for c in process.cpu_percent.call_args_list)
+
+    def test_chunked_loader_samples_memory_once_per_chunk(self, monkeypatch):
+        """Test memory is checked at chunk boundaries, not for every item."""
+        process = MagicMock(pid=resource_manager.os.getpid())
+        process.memory_info.return_value.rss = 0
+        monkeypatch.setattr(resource_manager, "_process", process)
+        progress = []
+
+        results = ChunkedLoader(chunk_size=10, on_progress=progress.append).load_large_dataset(
+            list(range(25)), lambda item: item * 2
+        )
+
+        assert results == [item * 2 for item in range(25)]
+        assert process.memory_info.call_count == 3
+        assert progress == [0.4, 0.8, 1.0]
+
+    def test_chunked_loader_memory_limit_from_config(self, monkeypatch):
+        """Test the config memory limit stops the load at a chunk boundary."""
+        from git_dungeon.config import GameConfig
+
+        process = MagicMock(pid=resource_manager.os.getpid())
+        process.memory_info.return_value.rss = 200 * 1024 * 1024
+        monkeypatch.setattr(resource_manager, "_process", process)
+        items = list(range(25))
+
+        assert len(ChunkedLoader(chunk_size=10).load_large_dataset(items, str)) == 25
+        limited = ChunkedLoader(chunk_size=10, config=GameConfig(max_memory_mb=100))
+        assert limited.load_large_dataset(items, str) == []
+
+
+class TestMetrics:
+    """Tests for metric recording."""
+
+    def test_record_metric_logs_once_only_at_debug(self, monkeypatch):
+        """Test a metric is logged once at DEBUG and skipped above it."""
+        debug = MagicMock()
+        monkeypatch.setattr(resource_manager.logger, "debug", debug)
+        level = resource_manager.logger.level
+        manager = ResourceManager()
+
+        try:
+            resource_manager.logger.setLevel(resource_manager.logging.INFO)
+            manager.record_metric("frame_ms", 16.6)
+            debug.assert_not_called()
+
+            resource_manager.logger.setLevel(resource_manager.logging.DEBUG)
+            manager.record_metric("frame_ms", 16.6)
+            debug.assert_called_once_with("Metric: %s = %s", "frame_ms", 16.6)
+        finally:
+            resource_manager.logger.setLevel(level)
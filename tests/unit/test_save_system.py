@@ -4,6 +4,7 @@ import subprocess
 
 import pytest
 
+from src.core import save_system as save_module
 from src.core.save_system import SaveSystem, SaveMetadata
 from src.core.game_engine import GameState
 from src.core.character import get_character
@@ -95,6 +96,17 @@ class TestSaveSystem:
         assert metadata.save_time != ""
         assert metadata.player_level >= 1
 
+    def test_save_metadata_is_immutable_and_flat(self):
+        """SaveMetadata is a frozen slotted record that serializes to its fields."""
+        from dataclasses import FrozenInstanceError, asdict
+
+        metadata = SaveMetadata.create(player_level=4, total_commits_defeated=2)
+
+        assert metadata.to_dict() == asdict(metadata)
+        assert not hasattr(metadata, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            metadata.player_level = 5
+
     def test_save_with_empty_game(self, tmp_path):
         """Test saving a game with no repository loaded."""
         game = GameState()
@@ -144,5 +156,173 @@ class TestSaveSystem:
         assert game.save_system.save_dir == save_dir
 
 
+    def test_save_encoding_matches_stdlib_json(self, tmp_path, monkeypatch):
+        """orjson and the stdlib fallback should write the same compact JSON."""
+        data = {"metadata": {"player_level": 3}, "player": {"name": "Dév"}, "defeated_commits": ["a"]}
+        path = tmp_path / "save_0.json"
+
+        encoded = save_module._encode_save(data)
+        monkeypatch.setattr(save_module, "orjson", None)
+        fallback = save_module._encode_save(data)
+
+        assert encoded == fallback
+        assert "Dév".encode("utf-8") in encoded
+        assert b" " not in encoded and b"\n" not in encoded
+        path.write_bytes(encoded)
+        assert save_module._read_save(path) == data
+        monkeypatch.undo()
+        assert save_module._read_save(path) == data  # mmap-backed when orjson is installed
+
+
+    def test_serialized_payload_matches_asdict(self):
+        """Shallow field copies should give the same payload dataclasses.asdict did."""
+        from dataclasses import asdict
+
+        from src.core.inventory import InventoryComponent, Item, ItemStats, ItemType
+
+        inventory = InventoryComponent()
+        stats = ItemStats(attack=3, luck_bonus=1)
+        inventory.items[0] = Item(id="sword", name="Sword", item_type=ItemType.WEAPON, stats=stats)
+        stats.enchanted = True  # not a declared field, so never saved
+        payload = SaveSystem._serialize_inventory(SaveSystem.__new__(SaveSystem), inventory)
+
+        assert payload["items"][0]["stats"] == asdict(stats)
+        payload["items"][0]["stats"]["attack"] = 99
+        assert stats.attack == 3
+
+
+    def test_save_slots_stream_only_metadata(self, tmp_path, monkeypatch):
+        """With ijson, slot listing stops once the metadata object is read."""
+        import json
+        from types import SimpleNamespace
+
+        consumed = []
+
+        def items(f, prefix, use_float=False):
+            for key, value in json.load(f).items():
+                consumed.append(key)
+                if key == prefix:
+                    yield value
+
+        save_dir = tmp_path / "saves"
+        save_system = SaveSystem(save_dir)
+        payload = {"version": "1.0.0", "metadata": {"player_level": 7}, "player": {}}
+        save_system.get_save_path(2).write_bytes(save_module._encode_save(payload))
+        monkeypatch.setattr(save_module, "ijson", SimpleNamespace(items=items))
+
+        slots = save_system.get_save_slots()
+
+        assert slots[2]["player_level"] == 7
+        assert consumed == ["version", "metadata"]
+        assert slots[0] == {"slot": 0, "exists": False}
+
+
+    def test_save_slots_read_metadata_sidecar(self, tmp_path, monkeypatch):
+        """Slot listing reads the small sidecar, and delete removes it too."""
+        save_system = SaveSystem(tmp_path / "saves")
+        assert save_system.save(GameState(), 1) is True
+        meta_path = save_system.get_metadata_path(1)
+        assert meta_path.exists()
+
+        def full_read(path):
+            raise AssertionError("save file should not be opened")
+
+        monkeypatch.setattr(save_module, "_read_save_metadata", full_read)
+        slot = save_system.get_save_slots()[1]
+        assert slot["exists"] is True
+        assert slot["save_time"] == save_module._read_save(meta_path)["save_time"]
+
+        assert save_system.delete_save(1) is True
+        assert not meta_path.exists()
+        assert not save_system.get_save_path(1).exists()
+
+    def test_save_slots_keep_order_around_bad_files(self, tmp_path):
+        """Slots are listed in order; a bad file only marks its slot."""
+        save_system = SaveSystem(tmp_path / "saves")
+        assert save_system.save(GameState(), 3) is True
+        save_system.get_save_path(5).write_bytes(b"not json")
+
+        slots = save_system.get_save_slots()
+
+        assert [slot["slot"] for slot in slots] == list(range(save_module.SAVE_SLOTS))
+        assert slots[3]["exists"] is True and "error" not in slots[3]
+        assert slots[5] == {"slot": 5, "exists": True, "error": True}
+        assert slots[4] == {"slot": 4, "exists": False}
+
+
+    def test_entity_stats_round_trip(self):
+        """Every stat is saved and restored, with defaults for missing keys."""
+        from src.core.character import CharacterComponent
+
+        save_system = SaveSystem.__new__(SaveSystem)
+        source, target = GameState().player, GameState().player
+        source.get_component(CharacterComponent).stats.luck.base_value = 42
+
+        data = save_system._serialize_entity(source)
+        assert list(data["stats"]) == list(save_module._STAT_DEFAULTS)
+        assert data["stats"]["luck"] == 42
+
+        del data["stats"]["attack"]
+        target.get_component(CharacterComponent).stats.attack.base_value = 99
+        save_system._deserialize_entity(target, data)
+        stats = target.get_component(CharacterComponent).stats
+        assert stats.luck.base_value == 42
+        assert stats.attack.base_value == save_module._STAT_DEFAULTS["attack"]
+
+    def test_settings_are_plain_json_values(self):
+        """Enum settings are stored as values and rebuild the same config."""
+        from src.config.settings import Difficulty
+
+        config = GameConfig(difficulty=Difficulty.HARD, max_commits=42)
+        settings = save_module._config_to_dict(config)
+
+        assert settings["difficulty"] == Difficulty.HARD.value
+        assert GameConfig(**settings) == config
+
+
+    def test_failed_save_keeps_previous_file(self, tmp_path, monkeypatch):
+        """A save that fails mid-write leaves the old save and no temp file."""
+        save_system = SaveSystem(tmp_path / "saves")
+        assert save_system.save(GameState(), 0) is True
+        before = save_system.get_save_path(0).read_bytes()
+
+        def broken_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(save_module.os, "replace", broken_replace)
+        assert save_system.save(GameState(), 0) is False
+
+        assert save_system.get_save_path(0).read_bytes() == before
+        assert sorted(p.name for p in save_system.save_dir.iterdir()) == ["save_0.json"]
+
+
+    def test_saves_are_compressed_and_plain_saves_still_load(self, tmp_path, monkeypatch):
+        """New saves are gzip; older uncompressed saves decode the same way."""
+        save_system = SaveSystem(tmp_path / "saves")
+        assert save_system.save(GameState(), 0) is True
+        path = save_system.get_save_path(0)
+        assert path.read_bytes()[:2] == save_module._GZIP_MAGIC
+
+        data = save_module._read_save(path)
+        legacy = tmp_path / "legacy.json"
+        legacy.write_bytes(save_module._encode_save(data))
+        assert save_module._read_save(legacy) == data
+
+        monkeypatch.setattr(save_module, "orjson", None)
+        assert save_module._read_save(path) == data
+        assert save_system.load(GameState(), 0) is True
+
+
+    def test_pretty_saves_opt_in(self, tmp_path, monkeypatch):
+        """GIT_DUNGEON_PRETTY_SAVES=1 writes readable JSON that loads normally."""
+        monkeypatch.setenv("GIT_DUNGEON_PRETTY_SAVES", "1")
+        save_system = SaveSystem(tmp_path / "saves")
+        assert save_system.save(GameState(), 0) is True
+
+        text = save_system.get_save_path(0).read_text(encoding="utf-8")
+        assert text.startswith('{\n  "version": "1.0.0"')
+        assert save_system.load(GameState(), 0) is True
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
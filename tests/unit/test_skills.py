@@ -39,6 +39,17 @@ class TestSkill:
         assert skill.cooldown == 0
         assert skill.effect is None
 
+    def test_shared_skills_are_immutable(self):
+        """Skills in the shared table are frozen, slotted and hashable."""
+        from dataclasses import FrozenInstanceError
+
+        skill = get_skill("git_add")
+
+        assert not hasattr(skill, "__dict__")
+        assert hash(skill) == hash(get_skill("git_add"))
+        with pytest.raises(FrozenInstanceError):
+            skill.mp_cost = 0
+
     def test_skill_with_effect(self):
         """Test skill with effect."""
         effect = SkillEffect(
@@ -114,6 +125,15 @@ class TestSkillsCollection:
         assert len(buff_skills) == 1
         assert buff_skills[0].id == "git_stash"
 
+    def test_get_skills_by_type_matches_scan(self):
+        """The prebuilt index should agree with scanning every skill."""
+        for skill_type in SkillType:
+            expected = [s for s in get_all_skills() if s.skill_type == skill_type]
+            assert get_skills_by_type(skill_type) == expected
+
+        get_skills_by_type(SkillType.ATTACK).clear()
+        assert get_skills_by_type(SkillType.ATTACK)
+
 
 class TestSkillBook:
     """Tests for SkillBook."""
@@ -168,6 +188,13 @@ class TestSkillBook:
         assert "git_add" in skill_ids
         assert "git_commit" in skill_ids
 
+    def test_unknown_skills_are_dropped_on_construction(self):
+        """Test a book built from a dict keeps only known skills."""
+        book = SkillBook(skills={"git_add": 2, "git_teleport": 9})
+
+        assert book.skills == {"git_add": 2}
+        assert [(s.id, level) for s, level in book.get_available_skills()] == [("git_add", 2)]
+
 
 class TestGitSkills:
     """Tests for Git-specific skills."""
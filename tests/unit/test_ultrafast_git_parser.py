@@ -0,0 +1,224 @@
+"""Unit tests for ultrafast_git_parser module."""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from git import InvalidGitRepositoryError
+
+import git_dungeon
+from git_dungeon.config import GameConfig
+from git_dungeon.core.ultrafast_git_parser import CommitInfo, FastGitParser, UltraFastGitParser
+
+
+@pytest.fixture
+def repo_path(tmp_path):
+    """A small repository with known line stats."""
+    path = tmp_path / "repo"
+    path.mkdir()
+
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=path, check=True, capture_output=True, text=True)
+
+    git("init")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test User")
+    (path / "a.txt").write_text("1\n2\n3\n", encoding="utf-8")
+    git("add", ".")
+    git("commit", "-m", "feat: three lines")
+    (path / "a.txt").write_text("1\n", encoding="utf-8")
+    (path / "b.txt").write_text("x\n", encoding="utf-8")
+    git("add", ".")
+    git("commit", "-m", "fix: a | b")
+    return path
+
+
+class TestUltraFastGitParser:
+    """Tests for UltraFastGitParser."""
+
+    def test_history_and_stats_come_from_one_git_call(self, repo_path):
+        """Test stats are read from the log itself, not per commit."""
+        parser = UltraFastGitParser()
+        parser.clear_cache()
+        parser.load_repository(str(repo_path))
+
+        with patch("subprocess.Popen", wraps=subprocess.Popen) as popen:
+            commits = parser.get_commit_history()
+
+        assert popen.call_count == 1
+        assert [c.message for c in commits] == ["fix: a | b", "feat: three lines"]
+        assert [(c.additions, c.deletions, c.files_changed) for c in commits] == [(1, 2, 2), (3, 0, 1)]
+        assert commits[0].short_sha == commits[0].hexsha[:8]
+        assert parser._stats_cache[commits[1].hexsha] == (3, 0, 1)
+
+        oldest_first = parser.get_commit_history(reverse=True)
+        assert [c.hexsha for c in oldest_first] == [c.hexsha for c in commits][::-1]
+        parser.clear_cache()
+
+    def test_import_uses_package_config(self):
+        """Test the module imports its config without patching sys.path."""
+        package_dir = str(Path(git_dungeon.__file__).parent)
+
+        assert package_dir not in sys.path
+        assert isinstance(UltraFastGitParser().config, GameConfig)
+
+    def test_limit_is_honored_exactly(self, repo_path):
+        """Test no limit reads everything and an explicit limit is passed as is."""
+        parser = UltraFastGitParser()
+        parser.load_repository(str(repo_path))
+
+        assert "-n" not in parser._log_command(None)
+        assert len(parser.get_commit_history()) == 2
+        assert len(parser.get_commit_history(limit=1)) == 1
+        assert parser.get_commit_history(limit=0) == []
+
+        commits = parser.iter_commit_history()
+        assert next(commits).message == "fix: a | b"
+        commits.close()
+        parser.clear_cache()
+
+    def test_columns_match_row_history(self, repo_path):
+        """Test SoA columns carry the same per-commit numbers as CommitInfo rows."""
+        parser = UltraFastGitParser()
+        parser.load_repository(str(repo_path))
+
+        rows = parser.get_commit_history()
+        columns = parser.get_commit_history_soa()
+
+        assert columns.hexsha == [c.hexsha for c in rows]
+        assert list(columns.additions) == [c.additions for c in rows]
+        assert sum(columns.files_changed) == 3
+        assert columns.commits_per_author() == {"Test User": 2}
+        assert len(parser.get_commit_history_soa(limit=1)) == 1
+        parser.clear_cache()
+
+    def test_stats_cache_is_bounded_lru(self, repo_path, monkeypatch):
+        """Test the stats cache keeps only the most recently used commits."""
+        parser = UltraFastGitParser()
+        parser.clear_cache()
+        parser.load_repository(str(repo_path))
+        monkeypatch.setattr(UltraFastGitParser, "_max_stats_cache_size", 1)
+
+        newest, oldest = parser.get_commit_history()
+
+        assert list(parser._stats_cache) == [oldest.hexsha]
+        parser.get_commit_history(limit=1)
+        assert list(parser._stats_cache) == [newest.hexsha]
+        parser.clear_cache()
+
+    def test_parsers_share_one_repo_cache(self, repo_path):
+        """Test a repo opened by one parser is reused by the other."""
+        UltraFastGitParser().clear_cache()
+        ultra, fast = UltraFastGitParser(), FastGitParser()
+
+        ultra.load_repository(str(repo_path))
+        fast.load_repository(str(repo_path))
+
+        assert fast._repo is ultra._repo
+        assert len(FastGitParser._repo_cache) == 1
+        ultra.clear_cache()
+
+    def test_equivalent_paths_share_a_cache_entry(self, repo_path, monkeypatch):
+        """Test different paths to one repository reuse the same Repo."""
+        parser = UltraFastGitParser()
+        parser.clear_cache()
+        (repo_path / "docs").mkdir()
+        monkeypatch.chdir(repo_path.parent)
+
+        parser.load_repository(str(repo_path))
+        first = parser._repo
+        parser.load_repository(str(repo_path / "docs"))
+        assert parser._repo is first
+        parser.load_repository(repo_path.name)
+        assert parser._repo is first
+
+        assert len(parser._repo_cache) == 1
+        with patch("git_dungeon.core.ultrafast_git_parser.Repo", side_effect=AssertionError):
+            parser.load_repository(str(repo_path / "docs"))
+
+        monkeypatch.chdir(repo_path)
+        with pytest.raises(ValueError):
+            parser.load_repository(repo_path.name)  # ./repo/repo does not exist
+        parser.clear_cache()
+
+    def test_fast_parser_limits_the_walk(self, repo_path):
+        """Test FastGitParser asks git for at most limit commits."""
+        parser = FastGitParser()
+        parser.load_repository(str(repo_path))
+
+        with patch.object(parser._repo, "iter_commits", wraps=parser._repo.iter_commits) as walk:
+            newest = parser.get_commit_history(limit=1)
+
+        walk.assert_called_once_with(max_count=1)
+        assert [c.message for c in newest] == ["fix: a | b"]
+        assert [c.message for c in parser.get_commit_history(reverse=True)] == [
+            "feat: three lines",
+            "fix: a | b",
+        ]
+        UltraFastGitParser().clear_cache()
+
+    def test_load_repository_errors(self, tmp_path):
+        """Test missing paths and non-repositories raise ValueError."""
+        parser = UltraFastGitParser()
+
+        with pytest.raises(ValueError, match="does not exist"):
+            parser.load_repository(str(tmp_path / "missing"))
+        with patch("git_dungeon.core.ultrafast_git_parser.Repo", side_effect=InvalidGitRepositoryError):
+            with pytest.raises(ValueError, match="Invalid Git repository"):
+                parser.load_repository(str(tmp_path))
+        assert parser._repo is None
+
+    def test_log_records_stream_and_stop_early(self, repo_path):
+        """Test records arrive one commit at a time and closing stops git."""
+        parser = UltraFastGitParser()
+        parser.load_repository(str(repo_path))
+
+        records = parser._iter_log_records(
+            ["git", "log", "--numstat", "--pretty=format:%x01%s"]
+        )
+        header, numstat = next(records)
+        records.close()
+
+        assert header == "fix: a | b"
+        assert sorted(line.split(b"\t")[2] for line in numstat if line.strip()) == [b"a.txt\n", b"b.txt\n"]
+        assert parser._sum_numstat(numstat) == (1, 2, 2)
+        parser.clear_cache()
+
+    def test_sum_numstat_counts_binary_files(self):
+        """Test binary files count as changed files without line counts."""
+        lines = [b"3\t1\tsrc/a.py\n", b"-\t-\tlogo.png\n", b"2\t0\t-dash.txt\n", b"\n"]
+
+        assert UltraFastGitParser._sum_numstat(lines) == (5, 1, 3)
+
+
+class TestCreatureName:
+    """Tests for commit-message creature names."""
+
+    def test_prefixes_match_like_startswith(self):
+        """Test the first listed prefix the message starts with wins."""
+        cases = {
+            "feat: add": "Feature",
+            "FIX(parser): crash": "Bug",
+            "cinema mode": "CI",
+            "optimize loop": "Optimization",
+            "hotfix: prod": "Hotfix",
+            "build(deps): bump": "Build",
+            "scope(ui) tweak": "Scope",
+            "Update README": "Update",
+            "   ": "Unknown",
+        }
+        for message, expected in cases.items():
+            commit = CommitInfo("a" * 40, "a" * 8, message, "Dev", "", "")
+            assert commit.get_creature_name() == expected, message
+
+    def test_creature_name_is_computed_once(self):
+        """Test repeated lookups reuse the first result."""
+        commit = CommitInfo("a" * 40, "a" * 8, "fix: crash", "Dev", "", "")
+
+        with patch("git_dungeon.core.ultrafast_git_parser._creature_name", return_value="Bug") as name:
+            assert commit.get_creature_name() == "Bug"
+            assert commit.get_creature_name() == "Bug"
+
+        assert name.call_count == 1